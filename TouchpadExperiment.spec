@@ -5,6 +5,7 @@ block_cipher = None
 # Define common source files to bundle
 common_sources = [
     ('analyzer_refactored.py', '.'),
+    ('numba_kernels.py', '.'),
     ('tablet_experiment.py', '.'),
     ('audio_processor.py', '.'),
     ('app_paths.py', '.'),
@@ -30,6 +31,7 @@ a_main = Analysis(
         'pygame',
         'numpy',
         'analyzer_refactored',
+        'numba_kernels',
         'tablet_experiment',
         'audio_processor',
         'app_paths',
@@ -58,6 +60,7 @@ a_analyzer = Analysis(
         'PyQt5.QtGui',
         'PyQt5.QtWidgets',
         'analyzer_refactored',
+        'numba_kernels',
         'app_paths',
     ],
     hookspath=[],
@@ -13,19 +13,36 @@ Refactored version with:
 import sys
 import os
 import json
-import math
 import csv
-from typing import List, Dict, Tuple, Optional, Any, Set
+import logging
+import functools
+from collections import OrderedDict, defaultdict
+from itertools import chain
+from operator import attrgetter
+from bisect import bisect_right
+from typing import List, Dict, Tuple, Optional, Any, Set, FrozenSet
 from dataclasses import dataclass, field
 
+import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QSlider, 
                              QFileDialog, QTreeWidget, QTreeWidgetItem, QSplitter, 
-                             QMessageBox, QComboBox, QTreeWidgetItemIterator, QInputDialog,
+                             QMessageBox, QComboBox, QInputDialog,
                              QDialog, QLineEdit, QDialogButtonBox, QFormLayout)
-from PyQt5.QtCore import Qt, QTimer, QPointF
+from PyQt5.QtCore import Qt, QTimer, QPointF, QLineF, QSignalBlocker
 from PyQt5.QtGui import QPainter, QPen, QColor, QBrush, QFont
 
+import numba_kernels
+
+# Optional C JSON decoder for participant files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Per-action traces are debug-level so they cost nothing unless logging is configured
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -36,6 +53,9 @@ HEBREW_KEYBOARD_MAP = {
     "'": ',', 'z': 'ז', 'x': 'ס', 'c': 'ב', 'v': 'ה', 'b': 'נ', 'n': 'מ', 'm': 'צ', ',': 'ת', '.': 'ץ',
     '/': '.'
 }
+# str.translate table for the map above, accepting either letter case
+HEBREW_TRANSLATION = str.maketrans({**{eng.upper(): heb for eng, heb in HEBREW_KEYBOARD_MAP.items()},
+                                    **HEBREW_KEYBOARD_MAP})
 
 TRAIN_MODE_MAP = {"Trainable": "trainable", "Low-Quality Trainable": "low-quality", "Untrainable": "untrainable"}
 TRAIN_MODE_DISPLAY = {v: k for k, v in TRAIN_MODE_MAP.items()}
@@ -49,6 +69,14 @@ STROKE_SELECTED_COLOR = QColor(0, 120, 215)  # Blue for selected strokes
 STROKE_NORMAL_COLOR = Qt.black
 STROKE_FUTURE_COLOR = QColor(200, 200, 200)  # Gray for future strokes
 LETTER_COLOR = QColor(0, 100, 0)  # Dark green for letter labels
+STROKE_STYLE_COLORS = {"selected": STROKE_SELECTED_COLOR, "past": STROKE_NORMAL_COLOR, "future": STROKE_FUTURE_COLOR}
+
+# Pen event types as stored in EventArrays.types
+TYPE_PRESS, TYPE_MOVE, TYPE_RELEASE = 0, 1, 2
+EVENT_TYPE_CODES = {"press": TYPE_PRESS, "move": TYPE_MOVE, "release": TYPE_RELEASE}
+
+# Strokes shorter than this are downsampled in plain Python (array setup costs more)
+DOWNSAMPLE_JIT_MIN_EVENTS = 32
 
 # =============================================================================
 # UTILITY FUNCTIONS
@@ -61,21 +89,30 @@ def format_time(seconds: float) -> str:
     return f"{minutes:02d}:{secs:06.3f}"
 
 def map_to_hebrew(char: str) -> str:
-    """Convert English keyboard char to Hebrew"""
-    return HEBREW_KEYBOARD_MAP.get(char.lower(), char)
+    """Convert English keyboard char (or a whole string) to Hebrew"""
+    return char.translate(HEBREW_TRANSLATION)
 
-def calculate_bounds(pen_events: List[dict]) -> Tuple[float, float, float, float]:
-    """Returns (min_x, min_y, max_x, max_y)"""
+def calculate_bounds(pen_events) -> Tuple[float, float, float, float]:
+    """Returns (min_x, min_y, max_x, max_y) for a list of pen events or an EventArrays"""
+    if isinstance(pen_events, EventArrays):
+        return pen_events.bounds()
     if not pen_events:
         return (0, 0, 0, 0)
     xs = [e["x"] for e in pen_events]
     ys = [e["y"] for e in pen_events]
     return min(xs), min(ys), max(xs), max(ys)
 
-def find_stroke_indices(pen_events: List[dict]) -> Tuple[List[int], List[int]]:
-    """Returns (stroke_starts, stroke_ends)"""
-    starts = [i for i, e in enumerate(pen_events) if e["type"] == "press"]
-    ends = [i for i, e in enumerate(pen_events) if e["type"] == "release"]
+def find_stroke_indices(pen_events) -> Tuple[List[int], List[int]]:
+    """Returns (stroke_starts, stroke_ends) for a list of pen events or an EventArrays"""
+    if isinstance(pen_events, EventArrays):
+        return pen_events.stroke_indices()
+    starts, ends = [], []
+    for i, e in enumerate(pen_events):
+        event_type = e["type"]
+        if event_type == "press":
+            starts.append(i)
+        elif event_type == "release":
+            ends.append(i)
     return starts, ends
 
 def get_sorted_letter_indices(assigned_letters: Dict[str, str]) -> List[int]:
@@ -84,14 +121,35 @@ def get_sorted_letter_indices(assigned_letters: Dict[str, str]) -> List[int]:
         return []
     return sorted(int(k) for k in assigned_letters.keys())
 
-def build_written_word(assigned_letters: Dict[str, str]) -> str:
-    """Build word from assigned letters in order (skipping blockers)"""
+def build_written_word(assigned_letters: Dict[str, str], sorted_indices: Optional[List[int]] = None) -> str:
+    """Build word from assigned letters in order (skipping blockers).
+    Callers that already hold get_sorted_letter_indices() can pass it as sorted_indices;
+    otherwise the result is shared with the memoized correctness computation.
+    """
     if not assigned_letters:
         return ""
-    sorted_indices = get_sorted_letter_indices(assigned_letters)
+    if sorted_indices is None:
+        return _written_and_flag(frozenset(assigned_letters.items()))[0]
     # Skip empty values (blockers)
     return ''.join(assigned_letters[str(idx)] for idx in sorted_indices if assigned_letters[str(idx)])
 
+def build_written_and_flag(assigned_letters: Dict[str, str],
+                           sorted_indices: Optional[List[int]] = None) -> Tuple[str, bool]:
+    """Returns (written_word, has_blocker) from a single pass over the assigned letters"""
+    if not assigned_letters:
+        return "", False
+    if sorted_indices is None:
+        sorted_indices = get_sorted_letter_indices(assigned_letters)
+    parts = []
+    blocked = False
+    for idx in sorted_indices:
+        char = assigned_letters[str(idx)]
+        if char:
+            parts.append(char)
+        else:
+            blocked = True
+    return ''.join(parts), blocked
+
 def has_blocker(assigned_letters: Dict[str, str]) -> bool:
     """Check if assigned letters contain any blocker (empty value)"""
     if not assigned_letters:
@@ -112,6 +170,16 @@ def downsample_stroke_events(events: List[dict], target_interval_ms: float = 25,
     if not events or len(events) <= 2:
         return events
     
+    # Distances are compared squared; a non-positive minimum keeps everything
+    min_distance_sq = min_distance_px * min_distance_px if min_distance_px > 0 else 0.0
+    
+    if numba_kernels.downsample_keep_mask_jit is not None and len(events) >= DOWNSAMPLE_JIT_MIN_EVENTS:
+        arrays = EventArrays.from_events(events)
+        is_edge = (arrays.types == TYPE_PRESS) | (arrays.types == TYPE_RELEASE)
+        keep = numba_kernels.downsample_keep_mask_jit(arrays.xs, arrays.ys, arrays.ts, is_edge,
+                                         float(target_interval_ms), float(min_distance_sq))
+        return [events[i] for i in np.flatnonzero(keep)]
+    
     filtered = []
     last_kept_event = None
     last_kept_time = None
@@ -138,10 +206,9 @@ def downsample_stroke_events(events: List[dict], target_interval_ms: float = 25,
         # Check distance threshold
         dx = event["x"] - last_kept_event["x"]
         dy = event["y"] - last_kept_event["y"]
-        distance = (dx**2 + dy**2)**0.5
         
         # Keep if either threshold exceeded
-        if time_delta_ms >= target_interval_ms or distance >= min_distance_px:
+        if time_delta_ms >= target_interval_ms or dx * dx + dy * dy >= min_distance_sq:
             filtered.append(event)
             last_kept_event = event
             last_kept_time = current_time
@@ -166,30 +233,26 @@ def check_partial_or_full_match(assigned_letters: Dict[str, str], target_word: s
         return False
     
     # Build the written word (skipping blockers)
-    written = build_written_word(assigned_letters)
-    
+    return written_matches_target(build_written_word(assigned_letters), target_word)
+
+def written_matches_target(written: str, target_word: str) -> bool:
+    """Match rule of check_partial_or_full_match for an already built written word"""
     if not written:
         return False
     
-    # Full match
-    if written == target_word:
-        return True
+    # Full match; a subsequence at least as long as the target must equal it
+    if len(written) >= len(target_word):
+        return written == target_word
     
     # Partial match: check if written is a subsequence of target_word
     # (all characters appear in order in the target)
     target_idx = 0
     for char in written:
         # Find char in target_word starting from target_idx
-        found = False
-        while target_idx < len(target_word):
-            if target_word[target_idx] == char:
-                target_idx += 1
-                found = True
-                break
-            target_idx += 1
-        
-        if not found:
+        target_idx = target_word.find(char, target_idx)
+        if target_idx < 0:
             return False
+        target_idx += 1
     
     return True
 
@@ -200,23 +263,36 @@ def compute_correctness_and_written(assigned_letters: Dict[str, str], original_w
     - No assigned letters -> correct, written = original
     - Partial/full subsequence match -> correct, written = original
     - Otherwise -> incorrect; written = "" if any blocker else the assigned letters string
+    Results are memoized on the letters' content, so repeated renders of an
+    unchanged word are a cache lookup.
     """
     if not assigned_letters:
         return True, original_word
+    return _correctness_and_written(frozenset(assigned_letters.items()), original_word)
+
+@functools.lru_cache(maxsize=4096)
+def _written_and_flag(letter_items: frozenset) -> Tuple[str, bool]:
+    return build_written_and_flag(dict(letter_items))
 
-    if check_partial_or_full_match(assigned_letters, original_word):
+@functools.lru_cache(maxsize=4096)
+def _correctness_and_written(letter_items: frozenset, original_word: str) -> Tuple[bool, str]:
+    written, blocked = _written_and_flag(letter_items)
+
+    if written_matches_target(written, original_word):
         return True, original_word
 
-    if has_blocker(assigned_letters):
+    if blocked:
         return False, ""
 
-    return False, build_written_word(assigned_letters)
+    return False, written
 
-def build_letter_segments(assigned_letters: Dict[str, str], num_events: int) -> List[dict]:
+def build_letter_segments(assigned_letters: Dict[str, str], num_events: int,
+                          sorted_indices: Optional[List[int]] = None) -> List[dict]:
     """Build letter segments with first/last event indices"""
     if not assigned_letters:
         return []
-    sorted_indices = get_sorted_letter_indices(assigned_letters)
+    if sorted_indices is None:
+        sorted_indices = get_sorted_letter_indices(assigned_letters)
     segments = []
     for i, start_idx in enumerate(sorted_indices):
         end_idx = sorted_indices[i + 1] - 1 if i < len(sorted_indices) - 1 else num_events - 1
@@ -231,11 +307,14 @@ def add_event_ids(pen_events: List[dict]) -> List[dict]:
     """Add event_id to each pen event (starting from 0)"""
     return [{**event, 'event_id': idx} for idx, event in enumerate(pen_events)]
 
-def should_be_low_quality(assigned_letters: Dict[str, str], pen_events: List[dict]) -> bool:
+def should_be_low_quality(assigned_letters: Dict[str, str], pen_events: List[dict],
+                          stroke_starts: Optional[List[int]] = None,
+                          sorted_indices: Optional[List[int]] = None) -> bool:
     """Check if word should be marked as low-quality trainable.
     Returns True if:
     - First assigned letter is not on the first stroke, OR
     - Any assigned letter is a blocker (empty value)
+    Pass stroke_starts / sorted_indices when they are already known.
     """
     if not assigned_letters or not pen_events:
         return False
@@ -245,12 +324,14 @@ def should_be_low_quality(assigned_letters: Dict[str, str], pen_events: List[dic
         return True
     
     # Check if first letter starts at first stroke
-    sorted_indices = get_sorted_letter_indices(assigned_letters)
+    if sorted_indices is None:
+        sorted_indices = get_sorted_letter_indices(assigned_letters)
     if not sorted_indices:
         return False
     
     first_letter_idx = sorted_indices[0]
-    stroke_starts, _ = find_stroke_indices(pen_events)
+    if stroke_starts is None:
+        stroke_starts, _ = find_stroke_indices(pen_events)
     
     if stroke_starts and first_letter_idx != stroke_starts[0]:
         return True
@@ -266,6 +347,15 @@ class LetterObject:
     """Represents an assigned letter with its associated strokes"""
     char: str  # The Hebrew character (empty string = blocker)
     stroke_ids: List[int]  # List of stroke indices that belong to this letter
+    _stroke_ids_set: FrozenSet[int] = field(init=False, repr=False, compare=False)
+    _min_stroke_id: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # stroke_ids is never mutated in place (edits build new letters), so
+        # the set used for selection tests and the sort key can be built once
+        self._stroke_ids_set = frozenset(self.stroke_ids)
+        # Letters are ordered by their first stroke; letters without strokes go last
+        self._min_stroke_id = min(self.stroke_ids) if self.stroke_ids else 999
     
     def to_dict(self) -> dict:
         return {
@@ -280,12 +370,25 @@ class LetterObject:
             stroke_ids=data.get('stroke_ids', [])
         )
 
+letter_sort_key = attrgetter("_min_stroke_id")
+
+def insert_letter_sorted(letters: List[LetterObject], new_letter: LetterObject):
+    """Add new_letter to letters in place, leaving them sorted by letter_sort_key.
+    
+    Same result as appending and stable-sorting; when letters are already in
+    order (the usual case after any assignment) it is a single insertion.
+    """
+    keys = [letter_sort_key(l) for l in letters]
+    if all(a <= b for a, b in zip(keys, keys[1:])):
+        letters.insert(bisect_right(keys, letter_sort_key(new_letter)), new_letter)
+    else:
+        letters.append(new_letter)
+        letters.sort(key=letter_sort_key)
+
 def get_stroke_id_for_event(event_idx: int, stroke_starts: List[int]) -> int:
     """Get the stroke ID (index) for a given event index"""
-    for i in range(len(stroke_starts) - 1, -1, -1):
-        if event_idx >= stroke_starts[i]:
-            return i
-    return 0
+    # stroke_starts is ascending: the stroke is the last start at or before the event
+    return max(0, bisect_right(stroke_starts, event_idx) - 1)
 
 def letters_to_assigned_letters(letters: List[LetterObject], stroke_starts: List[int]) -> Dict[str, str]:
     """Convert letter objects to legacy assigned_letters format for backward compatibility"""
@@ -293,19 +396,20 @@ def letters_to_assigned_letters(letters: List[LetterObject], stroke_starts: List
     for letter in letters:
         if letter.stroke_ids:
             # Use the first stroke's start event as the key
-            first_stroke_idx = min(letter.stroke_ids)
+            first_stroke_idx = letter._min_stroke_id
             if first_stroke_idx < len(stroke_starts):
                 event_idx = stroke_starts[first_stroke_idx]
                 assigned[str(event_idx)] = letter.char
     return assigned
 
-def assigned_letters_to_letters(assigned_letters: Dict[str, str], stroke_starts: List[int]) -> List[LetterObject]:
+def assigned_letters_to_letters(assigned_letters: Dict[str, str], stroke_starts: List[int],
+                                sorted_indices: Optional[List[int]] = None) -> List[LetterObject]:
     """Convert legacy assigned_letters to letter objects"""
     if not assigned_letters:
         return []
     
     letters = []
-    sorted_event_indices = sorted(int(k) for k in assigned_letters.keys())
+    sorted_event_indices = sorted_indices if sorted_indices is not None else get_sorted_letter_indices(assigned_letters)
     
     for event_idx in sorted_event_indices:
         char = assigned_letters[str(event_idx)]
@@ -314,10 +418,61 @@ def assigned_letters_to_letters(assigned_letters: Dict[str, str], stroke_starts:
     
     return letters
 
+# =============================================================================
+# EVENT ARRAYS
+# =============================================================================
+
+@dataclass
+class EventArrays:
+    """Column (structure-of-arrays) copy of a word's pen events.
+    
+    Built once when a word is loaded so repeated geometry work reduces over
+    contiguous arrays instead of looking keys up in every event dict.
+    Coordinates stay float64 so results match the dict-based code exactly.
+    The event dicts remain the source of truth and are what gets saved.
+    """
+    xs: np.ndarray
+    ys: np.ndarray
+    ts: np.ndarray  # absolute_time, 0 where missing
+    types: np.ndarray  # int8 TYPE_* codes, -1 for unknown types
+    pressures: np.ndarray  # 0 where missing
+    
+    @classmethod
+    def from_events(cls, pen_events: List[dict]) -> 'EventArrays':
+        n = len(pen_events)
+        return cls(
+            xs=np.fromiter((e["x"] for e in pen_events), np.float64, n),
+            ys=np.fromiter((e["y"] for e in pen_events), np.float64, n),
+            ts=np.fromiter((e.get("absolute_time", 0) for e in pen_events), np.float64, n),
+            types=np.fromiter((EVENT_TYPE_CODES.get(e["type"], -1) for e in pen_events), np.int8, n),
+            pressures=np.fromiter((e.get("pressure", 0) for e in pen_events), np.float64, n)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.xs)
+    
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """Returns (min_x, min_y, max_x, max_y)"""
+        if not len(self.xs):
+            return (0, 0, 0, 0)
+        min_x, min_y, max_x, max_y = numba_kernels.bounds(self.xs, self.ys)
+        return float(min_x), float(min_y), float(max_x), float(max_y)
+    
+    def stroke_indices(self) -> Tuple[List[int], List[int]]:
+        """Returns (stroke_starts, stroke_ends)"""
+        starts, ends = numba_kernels.stroke_indices(self.types, TYPE_PRESS, TYPE_RELEASE)
+        return starts.tolist(), ends.tolist()
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
+def _load_json_file(file_path: str):
+    """Parse a participant JSON file, with orjson when it is installed"""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw.decode('utf-8'))
+
 @dataclass
 class ParticipantData:
     """Encapsulates a participant's data"""
@@ -330,15 +485,19 @@ class ParticipantData:
     age: Any = None
     gender: str = None
     
-    # Cached computations per word
-    _stroke_cache: Dict[int, Tuple[List[int], List[int]]] = field(default_factory=dict, repr=False)
-    _bounds_cache: Dict[int, Tuple[float, float, float, float]] = field(default_factory=dict, repr=False)
+    # Cached computations per word, LRU order and bounded by WORD_CACHE_SIZE
+    WORD_CACHE_SIZE = 64
+    _stroke_cache: 'OrderedDict[int, Tuple[List[int], List[int]]]' = field(default_factory=OrderedDict, repr=False)
+    _bounds_cache: 'OrderedDict[int, Tuple[float, float, float, float]]' = field(default_factory=OrderedDict, repr=False)
+    # word_idx -> (the word's "letters" list it was parsed from, parsed letters)
+    _letters_cache: 'OrderedDict[int, Tuple[list, List[LetterObject]]]' = field(default_factory=OrderedDict, repr=False)
+    # Sorted (group name, word indices) for the tree; the word list is fixed after loading
+    _groups_cache: Optional[List[Tuple[str, List[int]]]] = field(default=None, repr=False)
     
     @classmethod
     def from_file(cls, file_path: str) -> 'ParticipantData':
         """Load participant data from JSON file"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json_file(file_path)
         
         # Handle both old (array) and new (dict with 'words') formats
         if isinstance(data, list):
@@ -360,19 +519,61 @@ class ParticipantData:
                 gender=data.get('participant_gender')
             )
     
+    def _cached_word_value(self, cache: OrderedDict, word_idx: int, compute):
+        """Look up word_idx in an LRU cache, computing from its pen events on a miss"""
+        if word_idx in cache:
+            cache.move_to_end(word_idx)
+            return cache[word_idx]
+        value = compute(self.words[word_idx].get('pen_events', []))
+        self._store_word_value(cache, word_idx, value)
+        return value
+    
+    def _store_word_value(self, cache: OrderedDict, word_idx: int, value):
+        """Insert into an LRU cache, evicting the oldest words beyond WORD_CACHE_SIZE"""
+        cache[word_idx] = value
+        cache.move_to_end(word_idx)
+        while len(cache) > self.WORD_CACHE_SIZE:
+            cache.popitem(last=False)
+    
     def get_stroke_indices(self, word_idx: int) -> Tuple[List[int], List[int]]:
         """Get cached stroke start/end indices for a word"""
-        if word_idx not in self._stroke_cache:
-            pen_events = self.words[word_idx].get('pen_events', [])
-            self._stroke_cache[word_idx] = find_stroke_indices(pen_events)
-        return self._stroke_cache[word_idx]
+        return self._cached_word_value(self._stroke_cache, word_idx, find_stroke_indices)
     
     def get_bounds(self, word_idx: int) -> Tuple[float, float, float, float]:
         """Get cached bounds for a word"""
-        if word_idx not in self._bounds_cache:
-            pen_events = self.words[word_idx].get('pen_events', [])
-            self._bounds_cache[word_idx] = calculate_bounds(pen_events)
-        return self._bounds_cache[word_idx]
+        return self._cached_word_value(self._bounds_cache, word_idx, calculate_bounds)
+    
+    def get_letters(self, word_idx: int) -> Optional[List[LetterObject]]:
+        """Get a word's parsed letters as a new list, or None if it has no "letters" key.
+        
+        Saving letters replaces word_data["letters"] with a new list, so the
+        cached parse is only reused while that exact list is still in place.
+        """
+        source = self.words[word_idx].get('letters')
+        if source is None:
+            return None
+        cached = self._letters_cache.get(word_idx)
+        if cached is not None and cached[0] is source:
+            self._letters_cache.move_to_end(word_idx)
+            return list(cached[1])
+        letters = [LetterObject.from_dict(l) for l in source]
+        self._store_word_value(self._letters_cache, word_idx, (source, letters))
+        return list(letters)
+    
+    def get_word_groups(self) -> List[Tuple[str, List[int]]]:
+        """(group name, indices of its words) sorted by group name, computed once"""
+        if self._groups_cache is None:
+            groups: Dict[str, List[int]] = defaultdict(list)
+            for i, word_data in enumerate(self.words):
+                groups[word_data.get("group", "unknown")].append(i)
+            self._groups_cache = sorted(groups.items(), key=lambda item: item[0])
+        return self._groups_cache
+    
+    def invalidate_word(self, word_idx: int):
+        """Drop cached computations for a word after its pen events were edited"""
+        self._stroke_cache.pop(word_idx, None)
+        self._bounds_cache.pop(word_idx, None)
+        self._letters_cache.pop(word_idx, None)
 
 # =============================================================================
 # CANVAS
@@ -387,6 +588,7 @@ class AnimationCanvas(QWidget):
         self.setStyleSheet("background-color: white;")
         
         self.pen_events: List[dict] = []
+        self.event_arrays = EventArrays.from_events([])  # Column copy of pen_events
         self.current_event_index = 0
         self.word_info: dict = {}
         
@@ -397,13 +599,39 @@ class AnimationCanvas(QWidget):
         self.selected_strokes: Set[int] = set()  # Set of selected stroke indices
         self.stroke_starts: List[int] = []
         self.stroke_ends: List[int] = []
+        self._stroke_starts_arr = np.empty(0, dtype=np.int32)  # stroke_starts for searchsorted
+        self._event_stroke_id = np.empty(0, dtype=np.int32)  # Stroke index of every event
+        self._pen_widths = np.empty(0, dtype=np.int32)  # Unselected pen width of every event
+        # Per-stroke sum of data-space x and event count, for letter label positions
+        self._stroke_sum_x: List[float] = []
+        self._stroke_counts: List[int] = []
+        # Screen-space event columns for the transform they were computed with
+        self._screen_coords: Optional[Tuple[tuple, np.ndarray, np.ndarray]] = None
+        # Spaced letter label x positions, reused while the transform and the
+        # letters list are unchanged: (transform, letters) -> [(x, letter)]
+        self._letter_layout: Optional[List[Tuple[float, LetterObject]]] = None
+        self._letter_layout_key: Optional[Tuple[tuple, List[LetterObject]]] = None
+        # Press/move events that stroke hit-testing measures against
+        self._hit_indices = np.empty(0, dtype=np.intp)
         
         # Transform state (cached)
         self._transform: Optional[Tuple[float, float, float, float, float, float, float]] = None
         self.parent_player = parent
+        
+        # Paint resources, created once instead of on every paint
+        self._pen_cache: Dict[Tuple[str, int], QPen] = {}  # (stroke style, width) -> pen
+        self._placeholder_font = QFont("Arial", 16)
+        self._title_font = QFont("Arial", 14, QFont.Bold)
+        self._letter_font = QFont("Arial", 24, QFont.Bold)
+        self._letter_pens = {True: QPen(STROKE_SELECTED_COLOR), False: QPen(LETTER_COLOR)}
     
-    def load_word_data(self, word_data: dict):
-        """Load pen data for a word"""
+    def load_word_data(self, word_data: dict, letters: Optional[List[LetterObject]] = None,
+                       stroke_indices: Optional[Tuple[List[int], List[int]]] = None):
+        """Load pen data for a word.
+        
+        letters and stroke_indices, if given, are already computed for this word
+        (parsed word_data["letters"] and find_stroke_indices of its events).
+        """
         self.word_info = {
             "word": word_data.get("word", ""),
             "cell": word_data.get("cell", 0),
@@ -411,12 +639,26 @@ class AnimationCanvas(QWidget):
             "audio_end_time": word_data.get("audio_end_time")
         }
         self.pen_events = word_data.get("pen_events", [])
+        self.event_arrays = EventArrays.from_events(self.pen_events)
         
         # Calculate stroke indices
-        self.stroke_starts, self.stroke_ends = find_stroke_indices(self.pen_events)
+        if stroke_indices is None:
+            stroke_indices = find_stroke_indices(self.event_arrays)
+        self.stroke_starts, self.stroke_ends = stroke_indices
+        self._stroke_starts_arr = np.asarray(self.stroke_starts, dtype=np.int32)
+        # Stroke of every event: the last stroke start at or before it (0 before the first)
+        self._event_stroke_id = np.maximum(np.searchsorted(
+            self._stroke_starts_arr, np.arange(len(self.pen_events)), side='right') - 1, 0).astype(np.int32)
+        # max(1, int(pressure * 5)) per event; astype truncates toward zero like int()
+        self._pen_widths = np.maximum(1, (self.event_arrays.pressures * 5).astype(np.int32))
+        self._compute_stroke_sums()
+        self._hit_indices = np.flatnonzero(
+            (self.event_arrays.types == TYPE_PRESS) | (self.event_arrays.types == TYPE_MOVE))
         
         # Load letters (new format) or convert from legacy assigned_letters
-        if "letters" in word_data:
+        if letters is not None:
+            self.letters = letters
+        elif "letters" in word_data:
             self.letters = [LetterObject.from_dict(l) for l in word_data["letters"]]
         elif "assigned_letters" in word_data:
             self.letters = assigned_letters_to_letters(
@@ -428,6 +670,7 @@ class AnimationCanvas(QWidget):
         
         self.current_event_index = 0
         self._transform = None  # Invalidate cache
+        self.invalidate_letter_layout()
         
         # Select first stroke by default
         self.selected_strokes = {0} if self.stroke_starts else set()
@@ -464,9 +707,8 @@ class AnimationCanvas(QWidget):
             first_selected = min(self.selected_strokes)
             self.current_event_index = self.stroke_starts[first_selected]
             if self.parent_player:
-                self.parent_player.event_slider.blockSignals(True)
-                self.parent_player.event_slider.setValue(self.current_event_index)
-                self.parent_player.event_slider.blockSignals(False)
+                with QSignalBlocker(self.parent_player.event_slider):
+                    self.parent_player.event_slider.setValue(self.current_event_index)
                 self.parent_player.update_info()
         
         self.update()
@@ -495,15 +737,14 @@ class AnimationCanvas(QWidget):
     
     def get_stroke_for_event(self, event_idx: int) -> int:
         """Get stroke index for an event index"""
-        for i in range(len(self.stroke_starts) - 1, -1, -1):
-            if event_idx >= self.stroke_starts[i]:
-                return i
-        return 0
+        if 0 <= event_idx < len(self._event_stroke_id):
+            return int(self._event_stroke_id[event_idx])
+        return max(0, int(np.searchsorted(self._stroke_starts_arr, event_idx, side='right')) - 1)
     
     def _ensure_transform(self) -> Tuple[float, float, float, float, float, float, float]:
         """Ensure transform is calculated, returns (scale, offset_x, offset_y, min_x, min_y, data_width, data_height)"""
         if self._transform is None and self.pen_events:
-            min_x, min_y, max_x, max_y = calculate_bounds(self.pen_events)
+            min_x, min_y, max_x, max_y = calculate_bounds(self.event_arrays)
             data_width = max_x - min_x
             data_height = max_y - min_y
             
@@ -526,6 +767,99 @@ class AnimationCanvas(QWidget):
         screen_y = (y - min_y) * scale + offset_y + 50
         return screen_x, screen_y
 
+    def _stroke_pen(self, style: str, width: int) -> QPen:
+        """Shared stroke pen for a style ("selected"/"past"/"future") and width"""
+        key = (style, width)
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            pen = QPen(STROKE_STYLE_COLORS[style], width, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+            self._pen_cache[key] = pen
+        return pen
+
+    def screen_coords(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Screen positions of all events, transformed as arrays.
+        
+        Reused until the transform changes (load or resize), so repaints during
+        playback do not re-transform every event.
+        """
+        transform = self._ensure_transform()
+        cached = self._screen_coords
+        if cached is not None and cached[0] is transform:
+            return cached[1], cached[2]
+        scale, offset_x, offset_y, min_x, min_y, _, _ = transform
+        screen_xs = (self.event_arrays.xs - min_x) * scale + offset_x
+        screen_ys = (self.event_arrays.ys - min_y) * scale + offset_y + 50
+        self._screen_coords = (transform, screen_xs, screen_ys)
+        return screen_xs, screen_ys
+
+    def _compute_stroke_sums(self):
+        """Sum x and count the events of every stroke (press through release), in data space.
+        
+        Data-space sums do not depend on the transform, so they are computed once
+        per word load and letter positions become O(strokes per letter).
+        """
+        n = len(self.pen_events)
+        valid = self.event_arrays.types >= 0
+        cum_x = np.concatenate(([0.0], np.cumsum(np.where(valid, self.event_arrays.xs, 0.0))))
+        cum_count = np.concatenate(([0], np.cumsum(valid)))
+        
+        starts = self._stroke_starts_arr.astype(np.intp)
+        ends = np.full(len(starts), n - 1, dtype=np.intp)
+        paired = min(len(starts), len(self.stroke_ends))
+        ends[:paired] = self.stroke_ends[:paired]
+        stops = np.maximum(np.minimum(ends + 1, n), starts)
+        
+        self._stroke_sum_x = (cum_x[stops] - cum_x[starts]).tolist()
+        self._stroke_counts = (cum_count[stops] - cum_count[starts]).tolist()
+
+    def _letter_average_xs(self) -> List[Tuple[int, float]]:
+        """(letter index, average screen x of its strokes' events) for letters that have events"""
+        scale, offset_x, _, min_x, _, _, _ = self._ensure_transform()
+        averages = []
+        for idx, letter in enumerate(self.letters):
+            if not letter.stroke_ids:
+                continue
+            
+            sum_x, count = 0.0, 0
+            for stroke_id in letter.stroke_ids:
+                if stroke_id < len(self.stroke_starts):
+                    sum_x += self._stroke_sum_x[stroke_id]
+                    count += self._stroke_counts[stroke_id]
+            
+            if count > 0:
+                averages.append((idx, (sum_x / count - min_x) * scale + offset_x))
+        return averages
+
+    def invalidate_letter_layout(self):
+        """Drop cached label positions; call after editing self.letters in place"""
+        self._letter_layout = None
+        self._letter_layout_key = None
+
+    def _letter_layout_positions(self) -> List[Tuple[float, LetterObject]]:
+        """Label x per letter, sorted and spaced so no two labels overlap"""
+        transform = self._ensure_transform()
+        key = self._letter_layout_key
+        if self._letter_layout is not None and key[0] == transform and key[1] is self.letters:
+            return self._letter_layout
+        
+        letter_positions = sorted(((avg_x, self.letters[idx]) for idx, avg_x in self._letter_average_xs()),
+                                  key=lambda item: item[0])
+        
+        # Sweep left to right, pushing each letter at least min_spacing past
+        # the one before it
+        min_spacing = 25  # Minimum pixels between letter centers
+        layout = []
+        prev_x = float('-inf')
+        for x, letter in letter_positions:
+            adjusted_x = max(x, prev_x + min_spacing)
+            layout.append((adjusted_x, letter))
+            prev_x = adjusted_x
+        
+        self._letter_layout = layout
+        # Holding the list itself keeps its identity from being reused
+        self._letter_layout_key = (transform, self.letters)
+        return layout
+
     def inverse_transform_point(self, screen_x: float, screen_y: float) -> Tuple[float, float]:
         """Transform screen coordinates to data coordinates"""
         scale, offset_x, offset_y, min_x, min_y, _, _ = self._ensure_transform()
@@ -540,22 +874,18 @@ class AnimationCanvas(QWidget):
         
         scale, _, _, _, _, _, _ = self._ensure_transform()
         click_x, click_y = self.inverse_transform_point(pos.x(), pos.y())
-        min_dist = float('inf')
-        closest_stroke_idx = None
-        current_stroke_idx = 0
+        if not len(self._hit_indices):
+            return None
         
-        for i, event in enumerate(self.pen_events):
-            if event["type"] == "press":
-                current_stroke_idx = self.get_stroke_for_event(i)
-            
-            if event["type"] in ("press", "move"):
-                dist = math.sqrt((click_x - event["x"])**2 + (click_y - event["y"])**2)
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_stroke_idx = current_stroke_idx
+        # Nearest press/move event; argmin keeps the first of equal distances
+        dist_sq = ((self.event_arrays.xs[self._hit_indices] - click_x) ** 2 +
+                   (self.event_arrays.ys[self._hit_indices] - click_y) ** 2)
+        nearest = int(dist_sq.argmin())
         
         threshold = 50 / scale if scale > 0 else 50
-        return closest_stroke_idx if min_dist < threshold else None
+        if dist_sq[nearest] >= threshold * threshold:
+            return None
+        return int(self._event_stroke_id[self._hit_indices[nearest]])
 
     def get_letter_at_position(self, pos) -> Optional[int]:
         """Find letter index at the given screen position (for the letter labels below canvas)"""
@@ -570,30 +900,10 @@ class AnimationCanvas(QWidget):
         if abs(pos.y() - letters_y_pos) > HIT_THRESHOLD_PX:
             return None
         
-        # Calculate average x position for each letter
-        for idx, letter in enumerate(self.letters):
-            if not letter.stroke_ids:
-                continue
-            
-            # Get events for this letter's strokes
-            sum_x, count = 0.0, 0
-            for stroke_id in letter.stroke_ids:
-                if stroke_id < len(self.stroke_starts):
-                    start_evt = self.stroke_starts[stroke_id]
-                    end_evt = self.stroke_ends[stroke_id] if stroke_id < len(self.stroke_ends) else len(self.pen_events) - 1
-                    
-                    for j in range(start_evt, end_evt + 1):
-                        if j < len(self.pen_events):
-                            evt = self.pen_events[j]
-                            if evt["type"] in ("press", "move", "release"):
-                                screen_x, _ = self.transform_point(evt["x"], evt["y"])
-                                sum_x += screen_x
-                                count += 1
-            
-            if count > 0:
-                avg_x = sum_x / count
-                if abs(pos.x() - avg_x) < HIT_THRESHOLD_PX:
-                    return idx
+        # Compare against the average x position of each letter
+        for idx, avg_x in self._letter_average_xs():
+            if abs(pos.x() - avg_x) < HIT_THRESHOLD_PX:
+                return idx
         
         return None
 
@@ -611,9 +921,8 @@ class AnimationCanvas(QWidget):
             if self.selected_strokes and self.parent_player:
                 first_stroke = min(self.selected_strokes)
                 self.current_event_index = self.stroke_starts[first_stroke]
-                self.parent_player.event_slider.blockSignals(True)
-                self.parent_player.event_slider.setValue(self.current_event_index)
-                self.parent_player.event_slider.blockSignals(False)
+                with QSignalBlocker(self.parent_player.event_slider):
+                    self.parent_player.event_slider.setValue(self.current_event_index)
                 self.parent_player.update_info()
             self.update()
             return
@@ -642,6 +951,7 @@ class AnimationCanvas(QWidget):
     def resizeEvent(self, event):
         """Handle resize - invalidate transform cache"""
         self._transform = None
+        self.invalidate_letter_layout()
         super().resizeEvent(event)
 
     def paintEvent(self, event):
@@ -652,17 +962,16 @@ class AnimationCanvas(QWidget):
         
         if not self.pen_events:
             painter.setPen(QPen(Qt.gray))
-            painter.setFont(QFont("Arial", 16))
+            painter.setFont(self._placeholder_font)
             painter.drawText(self.rect(), Qt.AlignCenter, "No pen data loaded")
             return
         
-        # Ensure transform is calculated
-        self._transform = None  # Recalculate on paint
+        # Transform is cached; load_word_data and resizeEvent invalidate it
         scale, offset_x, offset_y, min_x, min_y, data_width, data_height = self._ensure_transform()
         
         # Draw title
         painter.setPen(QPen(Qt.black))
-        painter.setFont(QFont("Arial", 14, QFont.Bold))
+        painter.setFont(self._title_font)
         title_text = f"Word: '{self.word_info.get('word', '')}' (Cell {self.word_info.get('cell', 0)})"
         
         audio_start = self.word_info.get('audio_start_time')
@@ -678,103 +987,73 @@ class AnimationCanvas(QWidget):
         painter.drawText(10, 25, title_text)
         
         # Draw strokes with selection highlighting
+        screen_xs, screen_ys = self.screen_coords()
+        # Outcode of every event against the widget rect, padded by the widest
+        # pen: a segment whose two ends share an outside edge is never visible
+        pad = 8
+        outcodes = ((screen_xs < -pad) * 1 | (screen_xs > self.width() + pad) * 2 |
+                    (screen_ys < -pad) * 4 | (screen_ys > self.height() + pad) * 8)
+        # Selection of every event, as one membership test over the stroke ids
+        selected_ids = np.fromiter(self.selected_strokes, dtype=np.int32, count=len(self.selected_strokes))
+        event_selected = np.isin(self._event_stroke_id, selected_ids)
+        # Contiguous segments sharing a pen are batched into one drawLines call;
+        # the run is flushed whenever the pen changes so draw order is kept
         last_point = None
-        current_stroke_idx = 0
+        last_outcode = 0
+        active_pen = None
+        segments: List[QLineF] = []
         
-        for i, event_data in enumerate(self.pen_events):
-            screen_x, screen_y = self.transform_point(event_data["x"], event_data["y"])
+        for i, (screen_x, screen_y, event_type, pen_width, is_selected, outcode) in enumerate(zip(
+                screen_xs.tolist(), screen_ys.tolist(), self.event_arrays.types.tolist(),
+                self._pen_widths.tolist(), event_selected.tolist(), outcodes.tolist())):
             point = QPointF(screen_x, screen_y)
-            pen_width = max(1, int(event_data["pressure"] * 5))
-            
-            # Track current stroke
-            if event_data["type"] == "press":
-                current_stroke_idx = self.get_stroke_for_event(i)
             
             # Determine color based on selection and timeline
-            is_selected = current_stroke_idx in self.selected_strokes
             is_past = i <= self.current_event_index
             
             if is_selected:
-                color = STROKE_SELECTED_COLOR
-                pen_width = max(2, pen_width + 1)  # Make selected strokes slightly thicker
+                style = "selected"
+                pen_width += 1  # Make selected strokes slightly thicker (widths are >= 1)
             elif is_past:
-                color = Qt.black
+                style = "past"
             else:
-                color = STROKE_FUTURE_COLOR
+                style = "future"
             
-            if event_data["type"] == "press":
-                last_point = point
-            elif event_data["type"] == "move" and last_point:
-                painter.setPen(QPen(color, pen_width, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-                painter.drawLine(last_point, point)
+            if event_type == TYPE_PRESS:
                 last_point = point
-            elif event_data["type"] == "release" and last_point:
-                painter.setPen(QPen(color, pen_width, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
-                painter.drawLine(last_point, point)
-                last_point = None
+                last_outcode = outcode
+            elif event_type in (TYPE_MOVE, TYPE_RELEASE) and last_point:
+                if not (outcode & last_outcode):
+                    pen = self._stroke_pen(style, pen_width)
+                    if pen is not active_pen:
+                        if segments:
+                            painter.drawLines(segments)
+                            segments = []
+                        painter.setPen(pen)
+                        active_pen = pen
+                    segments.append(QLineF(last_point, point))
+                last_point = point if event_type == TYPE_MOVE else None
+                last_outcode = outcode
+        if segments:
+            painter.drawLines(segments)
         
         # Draw current position indicator
         if self.current_event_index < len(self.pen_events):
-            current = self.pen_events[self.current_event_index]
-            screen_x, screen_y = self.transform_point(current["x"], current["y"])
             painter.setPen(QPen(Qt.red, 2))
             painter.setBrush(QBrush(Qt.red))
-            painter.drawEllipse(QPointF(screen_x, screen_y), 5, 5)
+            painter.drawEllipse(QPointF(screen_xs[self.current_event_index], screen_ys[self.current_event_index]), 5, 5)
 
         # Draw letter assignments
         if self.letters:
             drawing_bottom = offset_y + data_height * scale + 50
             y_pos = min(int(drawing_bottom + LETTER_Y_OFFSET), self.height() - 10)
             
-            painter.setFont(QFont("Arial", 24, QFont.Bold))
-            
-            # First pass: calculate average x positions for all letters
-            letter_positions = []  # List of (avg_x, letter, is_selected)
-            for letter in self.letters:
-                if not letter.stroke_ids:
-                    continue
-                
-                # Calculate average x position for this letter's strokes
-                sum_x, count = 0.0, 0
-                for stroke_id in letter.stroke_ids:
-                    if stroke_id < len(self.stroke_starts):
-                        start_evt = self.stroke_starts[stroke_id]
-                        end_evt = self.stroke_ends[stroke_id] if stroke_id < len(self.stroke_ends) else len(self.pen_events) - 1
-                        
-                        for j in range(start_evt, end_evt + 1):
-                            if j < len(self.pen_events):
-                                evt = self.pen_events[j]
-                                if evt["type"] in ("press", "move", "release"):
-                                    screen_x, _ = self.transform_point(evt["x"], evt["y"])
-                                    sum_x += screen_x
-                                    count += 1
-                
-                if count > 0:
-                    avg_x = sum_x / count
-                    is_selected = bool(self.selected_strokes & set(letter.stroke_ids))
-                    letter_positions.append((avg_x, letter, is_selected))
-            
-            # Second pass: adjust positions to avoid overlap
-            min_spacing = 25  # Minimum pixels between letter centers
-            adjusted_positions = []
-            for i, (x, letter, is_selected) in enumerate(letter_positions):
-                adjusted_x = x
-                # Check against all previously placed letters
-                for prev_x, _, _ in adjusted_positions:
-                    if abs(adjusted_x - prev_x) < min_spacing:
-                        # Push this letter to the right if too close
-                        if adjusted_x >= prev_x:
-                            adjusted_x = prev_x + min_spacing
-                        else:
-                            adjusted_x = prev_x - min_spacing
-                adjusted_positions.append((adjusted_x, letter, is_selected))
+            painter.setFont(self._letter_font)
             
-            # Third pass: draw letters at adjusted positions
-            for adjusted_x, letter, is_selected in adjusted_positions:
-                if is_selected:
-                    painter.setPen(QPen(STROKE_SELECTED_COLOR))
-                else:
-                    painter.setPen(QPen(LETTER_COLOR))
+            # Positions only change with geometry; selection only changes the pen
+            for adjusted_x, letter in self._letter_layout_positions():
+                is_selected = not self.selected_strokes.isdisjoint(letter._stroke_ids_set)
+                painter.setPen(self._letter_pens[is_selected])
                 
                 display_char = letter.char if letter.char else '|'
                 painter.drawText(int(adjusted_x) - 10, y_pos, display_char)
@@ -792,11 +1071,18 @@ class PenDataPlayer(QMainWindow):
         self.participants: List[ParticipantData] = []
         self.pen_data: List[dict] = []  # Flattened word list
         self.word_to_participant: Dict[int, int] = {}
+        self.participant_offsets: List[int] = []  # Flat index of each participant's first word
+        self._loaded_file_paths: Set[str] = set()  # file_path of every loaded participant
+        self._canvas_dirty = False  # A canvas repaint is already queued
+        # Word tree items in display order, and flat word index -> position in that list
+        self._word_items: List[QTreeWidgetItem] = []
+        self._word_idx_to_pos: Dict[int, int] = {}
         
         # State
         self.current_word_index = -1
         self.current_event_index = 0
         self.total_events = 0
+        self._delay_ms: List[int] = []  # Playback delay from each event to the next
         self.is_playing = False
         
         # Annotations (keyed by flattened word index)
@@ -1002,6 +1288,16 @@ class PenDataPlayer(QMainWindow):
         else:
             self.canvas.selected_strokes = set()
         self._update_selection_ui()
+        self._request_canvas_refresh()
+    
+    def _request_canvas_refresh(self):
+        """Queue one canvas repaint for the end of the current action"""
+        if not self._canvas_dirty:
+            self._canvas_dirty = True
+            QTimer.singleShot(0, self._flush_canvas)
+    
+    def _flush_canvas(self):
+        self._canvas_dirty = False
         self.canvas.update()
     
     def _update_selection_ui(self):
@@ -1023,35 +1319,27 @@ class PenDataPlayer(QMainWindow):
         
         if ok:
             stroke_ids = sorted(self.canvas.selected_strokes)
+            selected_set = frozenset(stroke_ids)
+            
+            # Remove any existing letters that used these stroke IDs
+            remaining_letters = [
+                l for l in self.canvas.letters 
+                if l._stroke_ids_set.isdisjoint(selected_set)
+            ]
             
             # Empty text = unassign (remove letters for these strokes)
             if not text:
-                # Remove any existing letters that used these stroke IDs
-                remaining_letters = [
-                    l for l in self.canvas.letters 
-                    if not (set(l.stroke_ids) & set(stroke_ids))
-                ]
-                self.canvas.letters = remaining_letters
-                print(f"Unassigned strokes {stroke_ids}")
+                logger.debug("Unassigned strokes %s", stroke_ids)
             else:
                 # Convert to Hebrew
                 hebrew_char = map_to_hebrew(text[0])
                 
-                # Create new letter object
+                # Insert the new letter in first-stroke order
                 new_letter = LetterObject(char=hebrew_char, stroke_ids=stroke_ids)
-                
-                # Remove any existing letters that used these stroke IDs
-                remaining_letters = [
-                    l for l in self.canvas.letters 
-                    if not (set(l.stroke_ids) & set(stroke_ids))
-                ]
-                remaining_letters.append(new_letter)
-                
-                # Sort by first stroke ID
-                remaining_letters.sort(key=lambda l: min(l.stroke_ids) if l.stroke_ids else 999)
-                
-                self.canvas.letters = remaining_letters
-                print(f"Assigned '{hebrew_char}' to strokes {stroke_ids}")
+                insert_letter_sorted(remaining_letters, new_letter)
+                logger.debug("Assigned '%s' to strokes %s", hebrew_char, stroke_ids)
+            
+            self.canvas.letters = remaining_letters
             
             # Save to word data
             word_data = self.pen_data[self.current_word_index]
@@ -1063,19 +1351,13 @@ class PenDataPlayer(QMainWindow):
             )
             
             self._update_train_mode_for_letters()
+            self._invalidate_correctness(self.current_word_index)
             
-            # Recompute correctness
-            original_word = word_data.get("word", "")
-            is_correct, written = compute_correctness_and_written(
-                word_data["assigned_letters"], original_word
-            )
-            self.word_correctness[self.current_word_index] = is_correct
-            self.written_words[self.current_word_index] = written
+            self._request_canvas_refresh()
             
-            self.canvas.update()
-        
-        self.activateWindow()
-        self.setFocus()
+            # Take focus back from the dialog so keyboard shortcuts keep working
+            self.activateWindow()
+            self.setFocus()
     
     def edit_letter(self, letter_idx: int):
         """Edit or delete a letter assignment"""
@@ -1097,18 +1379,18 @@ class PenDataPlayer(QMainWindow):
         
         if msg.clickedButton() == delete_btn:
             self.canvas.letters.pop(letter_idx)
+            self.canvas.invalidate_letter_layout()
             self._save_letters_to_word_data()
-            self.canvas.update()
-            print(f"Deleted letter '{current_char}'")
+            self._request_canvas_refresh()
+            logger.debug("Deleted letter '%s'", current_char)
+            self.activateWindow()
+            self.setFocus()
         elif msg.clickedButton() == replace_btn:
-            # Select the strokes and re-assign
+            # Select the strokes and re-assign (which restores focus itself)
             self.canvas.selected_strokes = set(letter.stroke_ids)
             self._update_selection_ui()
-            self.canvas.update()
+            self._request_canvas_refresh()
             self.assign_letter_to_selection()
-        
-        self.activateWindow()
-        self.setFocus()
     
     def _save_letters_to_word_data(self):
         """Save current letters to word data"""
@@ -1124,29 +1406,35 @@ class PenDataPlayer(QMainWindow):
         )
         
         self._update_train_mode_for_letters()
+        self._invalidate_correctness(self.current_word_index)
+    
+    def _invalidate_correctness(self, index: int):
+        """Forget a word's correctness/written word after its letters change.
+        
+        Nothing in the UI shows these, so they are only computed when an
+        export asks for them.
+        """
+        self.word_correctness.pop(index, None)
+        self.written_words.pop(index, None)
+    
+    def _resolve_written(self, flat_idx: int, assigned_letters: Dict[str, str],
+                         original_word: str) -> Tuple[bool, str]:
+        """Get (is_correct, written_word) for a word, computing and caching it on first use"""
+        is_correct = self.word_correctness.get(flat_idx)
+        written = self.written_words.get(flat_idx)
+        if is_correct is not None and written is not None:
+            logger.debug("  Using cached: is_correct=%s, written_word='%s'", is_correct, written)
+            return is_correct, written
         
-        # Recompute correctness
-        original_word = word_data.get("word", "")
-        is_correct, written = compute_correctness_and_written(
-            word_data["assigned_letters"], original_word
-        )
-        self.word_correctness[self.current_word_index] = is_correct
-        self.written_words[self.current_word_index] = written
-    
-    def _get_all_word_items(self) -> List[QTreeWidgetItem]:
-        """Get all word items from tree (flattened)"""
-        items = []
-        iterator = QTreeWidgetItemIterator(self.word_tree)
-        while iterator.value():
-            item = iterator.value()
-            if item.data(0, Qt.UserRole) is not None:
-                items.append(item)
-            iterator += 1
-        return items
+        is_correct, written = compute_correctness_and_written(assigned_letters, original_word)
+        logger.debug("  Calculated: is_correct=%s, written_word='%s'", is_correct, written)
+        self.word_correctness[flat_idx] = is_correct
+        self.written_words[flat_idx] = written
+        return is_correct, written
     
     def _navigate_word(self, direction: int):
         """Navigate to previous (-1) or next (+1) word"""
-        all_items = self._get_all_word_items()
+        all_items = self._word_items
         if not all_items:
             return
         
@@ -1156,10 +1444,7 @@ class PenDataPlayer(QMainWindow):
         if current_item:
             current_word_idx = current_item.data(0, Qt.UserRole)
             if current_word_idx is not None:
-                for i, item in enumerate(all_items):
-                    if item.data(0, Qt.UserRole) == current_word_idx:
-                        current_idx = i
-                        break
+                current_idx = self._word_idx_to_pos.get(current_word_idx, -1)
         
         if direction < 0:  # Previous
             new_idx = current_idx - 1 if current_idx > 0 else (len(all_items) - 1 if current_idx == -1 else 0)
@@ -1196,11 +1481,7 @@ class PenDataPlayer(QMainWindow):
             self.event_slider.setValue(self.current_event_index + 1)
             
             if self.is_playing and self.current_event_index < self.total_events - 1:
-                word_data = self.pen_data[self.current_word_index]
-                events = word_data["pen_events"]
-                delay_ms = int((events[self.current_event_index + 1]["absolute_time"] - 
-                               events[self.current_event_index]["absolute_time"]) * 1000)
-                self.play_timer.start(max(1, min(delay_ms, 1000)))
+                self.play_timer.start(self._delay_ms[self.current_event_index])
         else:
             self.stop_playback()
     
@@ -1236,21 +1517,21 @@ class PenDataPlayer(QMainWindow):
         if not file_paths:
             return
         
-        existing_paths = {p.file_path for p in self.participants}
         newly_added = 0
         
         for file_path in file_paths:
-            if file_path in existing_paths:
-                print(f"Skipped (already loaded): {file_path}")
+            if file_path in self._loaded_file_paths:
+                logger.debug("Skipped (already loaded): %s", file_path)
                 continue
             
             try:
                 participant = ParticipantData.from_file(file_path)
                 self.participants.append(participant)
+                self._loaded_file_paths.add(file_path)
                 newly_added += 1
-                print(f"Loaded: {file_path} (Participant {participant.participant_number})")
+                logger.debug("Loaded: %s (Participant %s)", file_path, participant.participant_number)
             except Exception as e:
-                print(f"Failed to load {file_path}: {e}")
+                logger.warning("Failed to load %s: %s", file_path, e)
                 QMessageBox.warning(self, "Load Error", f"Failed to load {file_path}:\n{str(e)}")
         
         if self.participants:
@@ -1259,53 +1540,73 @@ class PenDataPlayer(QMainWindow):
             self._update_loaded_label()
             self.export_btn.setEnabled(True)
             self.export_json_btn.setEnabled(True)
-            self.setFocus()
             
             if newly_added > 0:
                 QMessageBox.information(self, "Files Loaded", 
                     f"Added {newly_added} file(s).\nTotal: {len(self.participants)} file(s) loaded.")
+            self.setFocus()
     
     def _rebuild_flattened_data(self):
         """Rebuild flattened pen_data and mapping"""
-        self.pen_data = []
+        self.pen_data = list(chain.from_iterable(p.words for p in self.participants))
         self.word_to_participant = {}
+        self.participant_offsets = []
         
+        offset = 0
         for p_idx, participant in enumerate(self.participants):
-            for word_data in participant.words:
-                self.word_to_participant[len(self.pen_data)] = p_idx
-                self.pen_data.append(word_data)
+            self.participant_offsets.append(offset)
+            next_offset = offset + len(participant.words)
+            self.word_to_participant.update(dict.fromkeys(range(offset, next_offset), p_idx))
+            offset = next_offset
     
     def _populate_tree(self):
-        """Populate tree widget"""
+        """Populate tree widget.
+        
+        Items are built detached and attached in one addTopLevelItems call, with
+        repaints and signals suspended, so the view does not refresh per insert.
+        """
+        self.word_tree.setUpdatesEnabled(False)
+        self.word_tree.blockSignals(True)
+        try:
+            self._build_tree_items()
+        finally:
+            self.word_tree.blockSignals(False)
+            self.word_tree.setUpdatesEnabled(True)
+            self.word_tree.viewport().update()
+    
+    def _build_tree_items(self):
+        """Create participant/group/word items and attach them to the tree"""
         self.word_tree.clear()
+        self._word_items = []
+        self._word_idx_to_pos = {}
+        participant_items = []
         flat_idx = 0
         
         for participant in self.participants:
-            p_item = QTreeWidgetItem(self.word_tree)
+            p_item = QTreeWidgetItem()
             p_item.setText(0, f"Participant {participant.participant_number} ({len(participant.words)} words)")
-            p_item.setExpanded(True)
-            
-            # Build a mapping of word_data to their flat index
-            word_to_flat_idx = {}
-            for i, word_data in enumerate(participant.words):
-                word_to_flat_idx[id(word_data)] = flat_idx + i
+            participant_items.append(p_item)
             
             # Group by group name
-            groups: Dict[str, List[Tuple[dict, int]]] = {}
-            for i, word_data in enumerate(participant.words):
-                group = word_data.get("group", "unknown")
-                groups.setdefault(group, []).append((word_data, flat_idx + i))
-            
-            for group_name in sorted(groups.keys()):
+            for group_name, word_indices in participant.get_word_groups():
                 g_item = QTreeWidgetItem(p_item)
-                g_item.setText(0, f"  {group_name} ({len(groups[group_name])} words)")
+                g_item.setText(0, f"  {group_name} ({len(word_indices)} words)")
                 
-                for word_data, word_flat_idx in groups[group_name]:
+                for i in word_indices:
+                    word_data = participant.words[i]
+                    word_flat_idx = flat_idx + i
                     w_item = QTreeWidgetItem(g_item)
                     w_item.setText(0, f"    Cell {word_data.get('cell', 0)}: '{word_data.get('word', '')}' ({len(word_data.get('pen_events', []))} events)")
                     w_item.setData(0, Qt.UserRole, word_flat_idx)
+                    self._word_idx_to_pos[word_flat_idx] = len(self._word_items)
+                    self._word_items.append(w_item)
             
             flat_idx += len(participant.words)
+        
+        self.word_tree.addTopLevelItems(participant_items)
+        # Expansion only takes effect once the items are in the tree
+        for p_item in participant_items:
+            p_item.setExpanded(True)
     
     def _update_loaded_label(self):
         n = len(self.participants)
@@ -1323,58 +1624,63 @@ class PenDataPlayer(QMainWindow):
             if index is not None and 0 <= index < len(self.pen_data):
                 self.load_word(index)
     
+    def _participant_word(self, index: int) -> Tuple[ParticipantData, int]:
+        """(participant, index within its words) for a flat word index"""
+        p_idx = self.word_to_participant[index]
+        return self.participants[p_idx], index - self.participant_offsets[p_idx]
+    
     def load_word(self, index: int):
         self.stop_playback()
         self.current_word_index = index
         word_data = self.pen_data[index]
         
-        self.canvas.load_word_data(word_data)
+        participant, word_idx = self._participant_word(index)
+        self.canvas.load_word_data(word_data, participant.get_letters(word_idx),
+                                   participant.get_stroke_indices(word_idx))
         
         self.total_events = len(word_data.get("pen_events", []))
+        # int() truncation of the gap in ms, clamped to 1..1000 like the timer expects
+        gaps_ms = (np.diff(self.canvas.event_arrays.ts) * 1000).astype(np.int64)
+        self._delay_ms = np.clip(gaps_ms, 1, 1000).tolist()
         self.current_event_index = 0
         self.event_slider.setMaximum(max(0, self.total_events - 1))
         self.event_slider.setValue(0)
         
-        # Enable controls
-        for btn in [self.play_btn, self.prev_event_btn, self.next_event_btn, 
-                    self.prev_stroke_btn, self.next_stroke_btn, self.slice_btn]:
-            btn.setEnabled(True)
-        self.prev_word_btn.setEnabled(index > 0)
-        self.next_word_btn.setEnabled(index < len(self.pen_data) - 1)
-        
-        # Auto-populate written word and correctness
-        assigned_letters = word_data.get("assigned_letters", {})
-        original_word = word_data.get("word", "")
-        is_correct, written = compute_correctness_and_written(assigned_letters, original_word)
-
-        if assigned_letters:
-            debug_written = build_written_word(assigned_letters)
-            print(f"load_word({index}): '{original_word}', assigned={assigned_letters}, written='{debug_written}'")
-            print(f"  → computed: is_correct={is_correct}, written_word='{written}'")
-        else:
-            print(f"load_word({index}): '{original_word}', no assigned letters → is_correct=True")
-
-        self.word_correctness[index] = is_correct
-        self.written_words[index] = written
+        # Enable controls, touching only buttons whose state changes and
+        # repainting them together
+        self.setUpdatesEnabled(False)
+        try:
+            for btn, enabled in ((self.play_btn, True), (self.prev_event_btn, True),
+                                 (self.next_event_btn, True), (self.prev_stroke_btn, True),
+                                 (self.next_stroke_btn, True), (self.slice_btn, True),
+                                 (self.prev_word_btn, index > 0),
+                                 (self.next_word_btn, index < len(self.pen_data) - 1)):
+                if btn.isEnabled() != enabled:
+                    btn.setEnabled(enabled)
+        finally:
+            self.setUpdatesEnabled(True)
         
         # Update train mode
         mode = self.train_mode.get(index, "trainable")
-        self.train_mode_combo.setCurrentText(TRAIN_MODE_DISPLAY.get(mode, "Trainable"))
+        display = TRAIN_MODE_DISPLAY.get(mode, "Trainable")
+        if self.train_mode_combo.currentText() != display:
+            # Showing the stored mode is not a user change; don't write it back
+            with QSignalBlocker(self.train_mode_combo):
+                self.train_mode_combo.setCurrentText(display)
         
         # Update selection UI
         self._update_selection_ui()
         
         self.update_info()
-        self.activateWindow()
+        # Keep keys on the window after a tree click; no activateWindow, the
+        # window is already active when the user picks a word
         self.setFocus()
-        print(f"Loaded word {index + 1}/{len(self.pen_data)}: '{word_data.get('word', '')}'")
-        print(f"  → Strokes: {len(self.canvas.stroke_starts)}, Letters: {len(self.canvas.letters)}")
     
     def _get_current_stroke_starts(self) -> List[int]:
         if self.current_word_index < 0 or self.current_word_index >= len(self.pen_data):
             return []
-        pen_events = self.pen_data[self.current_word_index].get("pen_events", [])
-        return find_stroke_indices(pen_events)[0]
+        # The canvas computed these when the current word was loaded
+        return self.canvas.stroke_starts
     
     def slider_changed(self, value: int):
         self.current_event_index = value
@@ -1419,7 +1725,7 @@ class PenDataPlayer(QMainWindow):
         stroke_idx = self.canvas.get_stroke_for_event(stroke_start_idx)
         self.canvas.selected_strokes = {stroke_idx}
         self._update_selection_ui()
-        self.canvas.update()
+        self._request_canvas_refresh()
         self.assign_letter_to_selection()
     
     def _update_train_mode_for_letters(self):
@@ -1431,11 +1737,11 @@ class PenDataPlayer(QMainWindow):
         assigned = word_data.get("assigned_letters", {})
         pen_events = word_data.get("pen_events", [])
         
-        if should_be_low_quality(assigned, pen_events):
+        if should_be_low_quality(assigned, pen_events, self.canvas.stroke_starts):
             self.train_mode[self.current_word_index] = "low-quality"
-            self.train_mode_combo.blockSignals(True)
-            self.train_mode_combo.setCurrentText("Low-Quality Trainable")
-            self.train_mode_combo.blockSignals(False)
+            if self.train_mode_combo.currentText() != "Low-Quality Trainable":
+                with QSignalBlocker(self.train_mode_combo):
+                    self.train_mode_combo.setCurrentText("Low-Quality Trainable")
     
     def slice_stroke_at_current(self):
         """Slice the current stroke at the current event position"""
@@ -1458,15 +1764,15 @@ class PenDataPlayer(QMainWindow):
             return
         
         # Check we're not at first or last event of stroke
-        stroke_starts, stroke_ends = find_stroke_indices(pen_events)
+        participant, word_idx = self._participant_word(self.current_word_index)
+        stroke_starts, stroke_ends = participant.get_stroke_indices(word_idx)
         
-        # Find which stroke we're in
-        current_stroke_idx = None
-        for i, start in enumerate(stroke_starts):
-            end = stroke_ends[i] if i < len(stroke_ends) else len(pen_events) - 1
-            if start <= self.current_event_index <= end:
-                current_stroke_idx = i
-                break
+        # Find which stroke we're in: the last stroke starting at or before the
+        # event, unless the event comes after that stroke's release
+        current_stroke_idx = bisect_right(stroke_starts, self.current_event_index) - 1
+        if current_stroke_idx < 0 or (current_stroke_idx < len(stroke_ends) and
+                                      self.current_event_index > stroke_ends[current_stroke_idx]):
+            current_stroke_idx = None
         
         if current_stroke_idx is None:
             QMessageBox.warning(self, "Cannot Slice", "Could not find current stroke.")
@@ -1492,6 +1798,7 @@ class PenDataPlayer(QMainWindow):
         # The next event becomes a press (start of second stroke)
         if slice_event + 1 < len(pen_events):
             pen_events[slice_event + 1]["type"] = "press"
+        participant.invalidate_word(word_idx)
         
         # No need to shift assigned_letters indices since we're not inserting events
         # But we do need to update letters' stroke_ids
@@ -1536,7 +1843,8 @@ class PenDataPlayer(QMainWindow):
             return
         
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+            # 1 MiB buffer; rows are written once per participant
+            with open(file_path, 'w', newline='', encoding='utf-8-sig', buffering=1 << 20) as csvfile:
                 writer = csv.writer(csvfile)
                 
                 header = [
@@ -1549,6 +1857,9 @@ class PenDataPlayer(QMainWindow):
                 flat_idx = 0
                 total_words = 0
                 
+                rows = []
+                debug_export = logger.isEnabledFor(logging.DEBUG)
+                
                 for participant in self.participants:
                     for word_idx, word_data in enumerate(participant.words):
                         pen_events = word_data.get("pen_events", [])
@@ -1560,7 +1871,7 @@ class PenDataPlayer(QMainWindow):
                         audio_start = word_data.get("audio_start_time") or pen_events[0]["absolute_time"]
                         audio_end = word_data.get("audio_end_time")
                         
-                        stroke_starts, stroke_ends = find_stroke_indices(pen_events)
+                        stroke_starts, stroke_ends = participant.get_stroke_indices(word_idx)
                         
                         # First stroke time as reference for Letters column
                         first_stroke_time = pen_events[stroke_starts[0]]["absolute_time"] if stroke_starts else audio_start
@@ -1571,9 +1882,9 @@ class PenDataPlayer(QMainWindow):
                         
                         # Avg interval
                         if len(stroke_starts) > 1:
-                            intervals = [pen_events[stroke_starts[i]]["absolute_time"] - pen_events[stroke_starts[i-1]]["absolute_time"]
-                                        for i in range(1, len(stroke_starts))]
-                            avg_interval = sum(intervals) / len(intervals) * 1000
+                            start_times = np.fromiter((pen_events[i]["absolute_time"] for i in stroke_starts),
+                                                      np.float64, len(stroke_starts))
+                            avg_interval = float(np.diff(start_times).mean()) * 1000
                         else:
                             avg_interval = 0
                         
@@ -1581,52 +1892,39 @@ class PenDataPlayer(QMainWindow):
                         assigned_letters = word_data.get("assigned_letters", {})
                         letters_parts = []
                         if assigned_letters:
-                            sorted_indices = get_sorted_letter_indices(assigned_letters)
+                            # Key by event index once instead of str() per letter
+                            letters_by_idx = {int(k): char for k, char in assigned_letters.items()}
+                            sorted_indices = sorted(letters_by_idx)
                             # Last letter ends at last release event (same as Writing End)
                             last_event_idx = stroke_ends[-1] if stroke_ends else len(pen_events) - 1
-                            for i, start_idx in enumerate(sorted_indices):
-                                char = assigned_letters[str(start_idx)]
-                                # End index: next letter's start - 1, or last release event
-                                end_idx = sorted_indices[i + 1] - 1 if i < len(sorted_indices) - 1 else last_event_idx
-                                
-                                # Times in ms relative to audio_start (Reading Start)
-                                start_time_ms = int((pen_events[start_idx]["absolute_time"] - audio_start) * 1000)
-                                end_time_ms = int((pen_events[end_idx]["absolute_time"] - audio_start) * 1000)
-                                
-                                letters_parts.append(f"{char} {start_time_ms}/{end_time_ms}")
+                            # End index: next letter's start - 1, or last release event
+                            end_indices = [idx - 1 for idx in sorted_indices[1:]]
+                            end_indices.append(last_event_idx)
+                            
+                            # Times in ms relative to audio_start (Reading Start), truncated like int()
+                            n_letters = len(sorted_indices)
+                            bound_times = np.fromiter(
+                                (pen_events[i]["absolute_time"] for i in chain(sorted_indices, end_indices)),
+                                np.float64, 2 * n_letters)
+                            bound_ms = ((bound_times - audio_start) * 1000).astype(np.int64).tolist()
+                            letters_parts = [
+                                f"{letters_by_idx[start_idx]} {start_ms}/{end_ms}"
+                                for start_idx, start_ms, end_ms in zip(sorted_indices, bound_ms[:n_letters],
+                                                                       bound_ms[n_letters:])
+                            ]
                         
                         letters_str = ", ".join(letters_parts)
                         
                         # Calculate is_correct and written_word for this word
                         original_word = word_data.get("word", "")
                         
-                        # Debug: print assigned letters for this word
-                        if assigned_letters:
-                            written = build_written_word(assigned_letters)
-                            print(f"DEBUG word {word_idx + 1}: '{original_word}', assigned: {assigned_letters}, written: '{written}'")
+                        # Debug: log assigned letters for this word
+                        if assigned_letters and debug_export:
+                            written = build_written_word(assigned_letters, sorted_indices)
+                            logger.debug("Word %d: '%s', assigned: %s, written: '%s'",
+                                         word_idx + 1, original_word, assigned_letters, written)
                         
-                        # Check if cached in dictionaries (from UI)
-                        if flat_idx in self.word_correctness and flat_idx in self.written_words:
-                            is_correct = self.word_correctness[flat_idx]
-                            written_word = self.written_words[flat_idx]
-                            print(f"  Using cached: is_correct={is_correct}, written_word='{written_word}'")
-                        else:
-                            # Calculate based on logic
-                            if not assigned_letters:
-                                is_correct = True
-                                written_word = original_word
-                            elif check_partial_or_full_match(assigned_letters, original_word):
-                                is_correct = True
-                                written_word = original_word
-                                print(f"  Calculated: MATCH -> is_correct=True")
-                            else:
-                                is_correct = False
-                                if has_blocker(assigned_letters):
-                                    written_word = ""
-                                    print(f"  Calculated: NO MATCH + BLOCKER -> is_correct=False, written_word=''")
-                                else:
-                                    written_word = build_written_word(assigned_letters)
-                                    print(f"  Calculated: NO MATCH + NO BLOCKER -> is_correct=False, written_word='{written_word}'")
+                        is_correct, written_word = self._resolve_written(flat_idx, assigned_letters, original_word)
                         
                         row = [
                             word_idx + 1,
@@ -1644,8 +1942,11 @@ class PenDataPlayer(QMainWindow):
                             letters_str
                         ]
                         
-                        writer.writerow(row)
+                        rows.append(row)
                         flat_idx += 1
+                    
+                    writer.writerows(rows)
+                    rows.clear()
             
             QMessageBox.information(self, "Export Complete", f"Exported {total_words} words to:\n{file_path}")
             print(f"✓ Exported CSV: {file_path}")
@@ -1667,6 +1968,7 @@ class PenDataPlayer(QMainWindow):
         try:
             flat_idx = 0
             output = []
+            debug_export = logger.isEnabledFor(logging.DEBUG)
             
             for participant in self.participants:
                 p_output = {
@@ -1679,36 +1981,19 @@ class PenDataPlayer(QMainWindow):
                     'words': []
                 }
                 
-                for word_data in participant.words:
+                for word_idx, word_data in enumerate(participant.words):
                     # Calculate written_word based on the new logic
                     assigned_letters = word_data.get("assigned_letters", {})
                     original_word = word_data.get("word", "")
                     
-                    # Check if we have cached values
-                    written = self.written_words.get(flat_idx)
-                    is_correct = self.word_correctness.get(flat_idx)
-                    
-                    # If not cached, calculate based on logic
-                    if written is None or is_correct is None:
-                        if not assigned_letters:
-                            is_correct = True
-                            written = original_word
-                        elif check_partial_or_full_match(assigned_letters, original_word):
-                            is_correct = True
-                            written = original_word
-                        else:
-                            is_correct = False
-                            if has_blocker(assigned_letters):
-                                written = ""
-                            else:
-                                written = build_written_word(assigned_letters)
+                    is_correct, written = self._resolve_written(flat_idx, assigned_letters, original_word)
                     
                     trainability = self.train_mode.get(flat_idx, "trainable")
                     assigned = word_data.get("assigned_letters", {})
                     pen_events = word_data.get('pen_events', [])
                     
                     # Reorganize pen_events into strokes with downsampling
-                    stroke_starts, stroke_ends = find_stroke_indices(pen_events)
+                    stroke_starts, stroke_ends = participant.get_stroke_indices(word_idx)
                     strokes = []
                     total_original = 0
                     total_downsampled = 0
@@ -1733,10 +2018,11 @@ class PenDataPlayer(QMainWindow):
                             'events': downsampled_events
                         })
                     
-                    # Print compression stats for this word
-                    if total_original > 0:
+                    # Log compression stats for this word
+                    if total_original > 0 and debug_export:
                         compression = (1 - total_downsampled / total_original) * 100
-                        print(f"  Word '{original_word}': {total_original} → {total_downsampled} events ({compression:.1f}% reduction)")
+                        logger.debug("  Word '%s': %d → %d events (%.1f%% reduction)",
+                                     original_word, total_original, total_downsampled, compression)
                     
                     word_entry = {
                         'written_word': written,
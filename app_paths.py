@@ -39,3 +39,44 @@ def user_data_dir(app_name: str = "TouchpadExperimentManager") -> Path:
 def ensure_dir(path: Path) -> Path:
     path.mkdir(parents=True, exist_ok=True)
     return path
+
+
+class TempPool:
+    """Stable, per-context temp file paths that can be cleaned up together.
+
+    Every context maps to one fixed file under a private directory, so repeated
+    playback of the same context reuses the same path and release_all() can
+    clear the lot with a single directory scan.
+    """
+
+    def __init__(self, root: Path | None = None) -> None:
+        self.root = root if root is not None else user_data_dir() / "temp" / "pool"
+
+    def acquire(self, ctx: str) -> Path:
+        """Return the temp file path for a context (the file may not exist yet)."""
+
+        return ensure_dir(self.root) / f"autoscript_{ctx}.wav"
+
+    def release(self, ctx: str) -> None:
+        """Delete the temp file for a context, if present."""
+
+        try:
+            (self.root / f"autoscript_{ctx}.wav").unlink()
+        except OSError:
+            # Missing, or still held open by a media player
+            pass
+
+    def release_all(self) -> None:
+        """Delete every file in the pool."""
+
+        try:
+            entries = os.scandir(self.root)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_file():
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
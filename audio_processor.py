@@ -134,7 +134,7 @@ class AudioProcessor:
             self.log(f"  ✗ Error converting: {e.stderr}")
             raise
     
-    def get_temp_segment_file(self, input_file, start_ms, end_ms, context="default"):
+    def get_temp_segment_file(self, input_file, start_ms, end_ms, context="default", output_path=None):
         """
         Extract a segment to a temporary WAV file for playback.
         
@@ -143,6 +143,7 @@ class AudioProcessor:
             start_ms (int): Start time in ms
             end_ms (int): End time in ms
             context (str): Context name to avoid file conflicts between different players
+            output_path (str): Where to write the segment (default: temp_playback_{context}.wav)
             
         Returns:
             str: Path to temporary WAV file for playback
@@ -164,9 +165,12 @@ class AudioProcessor:
             
             segment = sound[start_ms:end_ms]
             
-            # Export to context-specific temp file for playback
-            temp_playback = str(temp_dir / f"temp_playback_{context}.wav")
-            segment.export(temp_playback, format="wav")
+            # Export to context-specific temp file for playback. Write next to it
+            # and swap it in, so a reader never sees a half-written file.
+            temp_playback = str(output_path or temp_dir / f"temp_playback_{context}.wav")
+            partial = temp_playback + ".part"
+            segment.export(partial, format="wav").close()
+            os.replace(partial, temp_playback)
             
             # Cleanup full temp
             if os.path.exists(temp_full_wav):
@@ -1,9 +1,14 @@
 import sys
 import os
 import json
+import time
 import zipfile
 import tempfile
-import shutil
+import wave
+import hashlib
+import threading
+import bisect
+from collections import OrderedDict
 import numpy as np
 from pathlib import Path
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
@@ -12,11 +17,14 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QSpinBox, QComboBox, QRadioButton, QCheckBox, 
                              QLineEdit, QFormLayout, QDialog, QScrollArea,
                              QApplication)
-from PyQt5.QtCore import Qt, QUrl, QPointF, QRectF
-from PyQt5.QtGui import QColor, QPainter, QPen, QPolygonF
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+from PyQt5.QtCore import (Qt, QUrl, QRectF, QLineF, QTimer, QObject, QRunnable,
+                          QThreadPool, pyqtSignal)
+from PyQt5.QtGui import QColor, QPainter, QPen, QPixmap
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent, QMediaPlaylist
 from pydub import AudioSegment
 
+from app_paths import TempPool
+
 # Import AudioProcessor
 try:
     from audio_processor import AudioProcessor
@@ -24,6 +32,99 @@ except ImportError:
     # Handle case where audio_processor might be missing or has issues
     AudioProcessor = None
 
+# Optional C JSON encoder for the experiment manifest
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _manifest_bytes(json_data):
+    """Serialize the manifest as compact UTF-8 JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(json_data)
+    return json.dumps(json_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _pcm16_wav_layout(file_path):
+    """Return (data_offset, channels, frame_rate, n_frames) for a 16-bit PCM WAV, else None"""
+    if Path(file_path).suffix.lower() != '.wav':
+        return None
+    try:
+        with open(file_path, 'rb') as f:
+            with wave.open(f, 'rb') as wav:
+                # wave stops right after the 'data' chunk header
+                data_offset = f.tell()
+                if wav.getsampwidth() != 2:
+                    return None
+                return data_offset, wav.getnchannels(), wav.getframerate(), wav.getnframes()
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+def _decode_pcm_frames(source_path, processor):
+    """Decode a source to (frames, frame_rate, sample_width), one row of PCM per frame.
+    
+    16-bit PCM WAVs are read as they are; anything else goes through
+    processor.convert_to_wav and pydub, keeping the decoded sample width
+    (8/24/32-bit have no '<i2' layout, so rows are raw bytes).
+    """
+    layout = _pcm16_wav_layout(source_path)
+    if layout:
+        data_offset, channels, frame_rate, n_frames = layout
+        samples = np.fromfile(source_path, dtype='<i2', count=n_frames * channels,
+                              offset=data_offset).reshape(-1, channels)
+        return samples, frame_rate, 2
+    with tempfile.TemporaryDirectory() as convert_dir:
+        temp_wav = os.path.join(convert_dir, "source.wav")
+        processor.convert_to_wav(source_path, temp_wav)
+        sound = AudioSegment.from_wav(temp_wav)
+    samples = np.frombuffer(sound.raw_data, dtype=np.uint8).reshape(-1, sound.channels * sound.sample_width)
+    return samples, sound.frame_rate, sound.sample_width
+
+
+def _write_wav_frames(file_obj, samples, frame_rate, sample_width):
+    """Write frames from _decode_pcm_frames as a WAV, without seeking back"""
+    with wave.open(file_obj, 'wb') as wav:
+        wav.setnchannels(samples.shape[1] * samples.itemsize // sample_width)
+        wav.setsampwidth(sample_width)
+        wav.setframerate(frame_rate)
+        # Declared up front so wave never seeks back to patch the header
+        wav.setnframes(len(samples))
+        # Empty slices (start == end, or past the source's end) are a
+        # valid 0-frame WAV; wave cannot cast a zero-length 2-D view
+        if len(samples):
+            wav.writeframes(samples)
+
+
+class _SegmentPrefetchSignals(QObject):
+    """Signals for _SegmentPrefetchJob (QRunnable itself cannot emit)"""
+    # (file_path, start, end) key, temp file or None, cache generation it was started in
+    done = pyqtSignal(object, object, int)
+
+
+class _SegmentPrefetchJob(QRunnable):
+    """Extract a slice's playback file on a pool thread"""
+    
+    def __init__(self, extract, key, output_path, generation):
+        super().__init__()
+        self.extract = extract
+        self.key = key
+        self.output_path = output_path
+        self.generation = generation
+        self.signals = _SegmentPrefetchSignals()
+        # Kept alive by the wizard's _prefetching map until its done signal is
+        # handled, so the wizard can still tryTake it off the pool
+        self.setAutoDelete(False)
+
+    def run(self):
+        self.signals.done.emit(self.key, self.extract(self.key, self.output_path), self.generation)
+
+
+class _TextFileReader(QObject):
+    """Hands text read on a worker thread back to the UI thread"""
+    done = pyqtSignal(str, str)  # group name, file contents
+
 
 class WaveformWidget(QWidget):
     """Widget for displaying and editing audio waveform with start/end markers"""
@@ -32,6 +133,9 @@ class WaveformWidget(QWidget):
         super().__init__(parent)
         self.setMinimumHeight(200)
         self.audio_data = None
+        self.env_min = None
+        self.env_max = None
+        self.max_amp = 1.0
         self.sample_rate = 44100
         self.duration_ms = 0
         
@@ -43,6 +147,12 @@ class WaveformWidget(QWidget):
         
         self.dragging = None  # 'start', 'end', or None
         
+        # Off-screen copy of the static waveform; markers are drawn on top of it.
+        # _pix_key records the view it was rendered for.
+        self._wave_pixmap = None
+        self._pix_key = None
+        self._audio_id = 0
+        
         # Colors
         self.wave_color = QColor(24, 119, 242)
         self.start_color = QColor(76, 175, 80)
@@ -54,24 +164,39 @@ class WaveformWidget(QWidget):
     def set_audio_data(self, file_path, start_ms, end_ms):
         """Load audio data for visualization"""
         try:
-            # Load audio
-            audio = AudioSegment.from_file(file_path)
-            
-            # Convert to mono and get samples
-            audio = audio.set_channels(1)
-            self.sample_rate = audio.frame_rate
-            self.duration_ms = len(audio)
-            
-            # Get raw data as numpy array
-            samples = np.array(audio.get_array_of_samples())
-            
-            # Downsample for display (max 10000 points for performance)
-            target_points = 10000
-            if len(samples) > target_points:
-                step = len(samples) // target_points
-                self.audio_data = samples[::step]
+            layout = _pcm16_wav_layout(file_path)
+            if layout:
+                # Map 16-bit PCM WAV samples straight from disk, no decode copy
+                data_offset, channels, frame_rate, n_frames = layout
+                samples = np.memmap(file_path, dtype='<i2', mode='r', offset=data_offset,
+                                    shape=(n_frames * channels,))
+                self.sample_rate = frame_rate
+                self.duration_ms = n_frames * 1000 / frame_rate
             else:
-                self.audio_data = samples
+                # Load audio
+                audio = AudioSegment.from_file(file_path)
+                
+                # Convert to mono and get samples
+                audio = audio.set_channels(1)
+                channels = 1
+                self.sample_rate = audio.frame_rate
+                self.duration_ms = len(audio)
+                
+                # Get raw data as numpy array
+                samples = np.array(audio.get_array_of_samples())
+            
+            # Min/max envelope for display (max 10000 points for performance)
+            self.env_min, self.env_max, self.max_amp = self._compute_envelope_and_max(
+                samples, channels, 10000)
+            # Drop the mapping now so the file is not held open
+            del samples
+            
+            # Normalize once to [-1, 1] so painting needs no per-sample scaling
+            envelope = np.empty((len(self.env_min), 2), dtype=np.float32)
+            envelope[:, 0] = self.env_min
+            envelope[:, 1] = self.env_max
+            envelope /= self.max_amp
+            self.audio_data = envelope
                 
             self.start_ms = start_ms
             self.end_ms = end_ms
@@ -79,14 +204,39 @@ class WaveformWidget(QWidget):
             # Center view on the word
             self.zoom_to_fit_word()
             
+            self._audio_id += 1
+            self._pix_key = None
             self.update()
             
         except Exception as e:
             print(f"Error loading waveform: {e}")
 
+    @staticmethod
+    def _compute_envelope_and_max(samples, channels, target_points, block_buckets=256):
+        """Return (env_min, env_max, max_amp) from one blockwise pass over the samples"""
+        n_frames = len(samples) // channels
+        step = max(1, n_frames // target_points)
+        n_buckets = n_frames // step
+        bucket_len = step * channels
+        
+        env_min = np.empty(n_buckets, dtype=np.float32)
+        env_max = np.empty(n_buckets, dtype=np.float32)
+        max_amp = 0.0
+        for first in range(0, n_buckets, block_buckets):
+            last = min(n_buckets, first + block_buckets)
+            block = samples[first * bucket_len:last * bucket_len].reshape(last - first, bucket_len)
+            low = block.min(axis=1)
+            high = block.max(axis=1)
+            env_min[first:last] = low
+            env_max[first:last] = high
+            # The peak is the largest bucket extreme, no separate abs() scan needed
+            max_amp = max(max_amp, -float(low.min()), float(high.max()))
+        
+        return env_min, env_max, (max_amp or 1.0)
+
     def zoom_to_fit_word(self):
         """Zoom and scroll to show the word with some margin"""
-        if self.duration_ms == 0:
+        if self.duration_ms <= 0:
             return
             
         word_len = self.end_ms - self.start_ms
@@ -105,6 +255,8 @@ class WaveformWidget(QWidget):
 
     def ms_to_x(self, ms):
         """Convert time (ms) to x coordinate"""
+        if self.duration_ms <= 0:
+            return 0
         width = self.width()
         total_visible_ms = self.duration_ms / self.zoom_level
         start_visible_ms = self.scroll_offset * self.duration_ms
@@ -114,6 +266,8 @@ class WaveformWidget(QWidget):
 
     def x_to_ms(self, x):
         """Convert x coordinate to time (ms)"""
+        if self.duration_ms <= 0:
+            return 0
         width = self.width()
         total_visible_ms = self.duration_ms / self.zoom_level
         start_visible_ms = self.scroll_offset * self.duration_ms
@@ -121,24 +275,16 @@ class WaveformWidget(QWidget):
         rel_ms = (x / width) * total_visible_ms
         return start_visible_ms + rel_ms
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    def _render_wave_pixmap(self):
+        """Render background and waveform into an off-screen pixmap"""
+        pixmap = QPixmap(self.size())
+        pixmap.fill(self.bg_color)
+        self._wave_pixmap = pixmap
         
-        # Background
-        painter.fillRect(self.rect(), self.bg_color)
-        
-        if self.audio_data is None:
-            painter.drawText(self.rect(), Qt.AlignCenter, "No Audio Data")
-            return
-            
         width = self.width()
         height = self.height()
         mid_y = height / 2
         
-        # Draw Waveform
-        painter.setPen(QPen(self.wave_color, 1))
-        
         # Calculate visible range in samples
         total_samples = len(self.audio_data)
         visible_samples = int(total_samples / self.zoom_level)
@@ -150,27 +296,54 @@ class WaveformWidget(QWidget):
         
         # Draw points
         subset = self.audio_data[start_sample:end_sample]
-        if len(subset) == 0: 
+        if len(subset) == 0 or width <= 0: 
             return
         
-        # Normalize amplitude to height
-        max_amp = np.max(np.abs(self.audio_data)) if len(self.audio_data) > 0 else 1
-        if max_amp == 0: 
-            max_amp = 1
+        # Fold the visible buckets into one vertical min/max line per column
+        n = len(subset)
+        columns = min(width, n)
+        edges = np.arange(columns) * n // columns
+        lows = np.minimum.reduceat(subset[:, 0], edges)
+        highs = np.maximum.reduceat(subset[:, 1], edges)
+        xs = np.arange(columns) * (width / columns) + 0.5
+        
+        scale = (height / 2) * 0.9
+        # Half a pixel of padding keeps silent stretches visible as a flat line
+        lines = [QLineF(x, mid_y - high * scale - 0.5, x, mid_y - low * scale + 0.5)
+                 for x, low, high in zip(xs.tolist(), lows.tolist(), highs.tolist())]
+        
+        # Aliased 1px lines take Qt's fast raster path; antialiasing is only
+        # worth it for the marker text drawn in paintEvent
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setPen(QPen(self.wave_color, 1))
+        painter.drawLines(lines)
+        painter.end()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        if self.audio_data is None:
+            # Background
+            painter.fillRect(self.rect(), self.bg_color)
+            painter.drawText(self.rect(), Qt.AlignCenter, "No Audio Data")
+            return
         
-        # Create polygon points
-        points = []
-        step = max(1, len(subset) // width)
+        # Waveform only changes with data, zoom or size - dragging a marker
+        # just blits the cached copy and redraws the overlay
+        key = (self.zoom_level, self.scroll_offset, self.width(), self.height(), self._audio_id)
+        if key != self._pix_key or self._wave_pixmap is None:
+            self._render_wave_pixmap()
+            self._pix_key = key
+        painter.drawPixmap(0, 0, self._wave_pixmap)
         
-        for i in range(0, len(subset), step):
-            x = (i / len(subset)) * width
-            amp = subset[i] / max_amp
-            y = mid_y - (amp * (height / 2) * 0.9)
-            points.append(QPointF(x, y))
-            
-        if points:
-            painter.drawPolyline(QPolygonF(points))
+        if self.duration_ms <= 0:
+            # 0-frame audio: nothing to place the markers against
+            return
             
+        height = self.height()
+        
         # Draw Markers
         start_x = self.ms_to_x(self.start_ms)
         end_x = self.ms_to_x(self.end_ms)
@@ -244,6 +417,9 @@ class WaveformWidget(QWidget):
         self.dragging = None
 
     def wheelEvent(self, event):
+        if self.duration_ms <= 0:
+            return
+        
         # Zoom in/out
         delta = event.angleDelta().y()
         zoom_factor = 1.1 if delta > 0 else 0.9
@@ -264,8 +440,13 @@ class WaveformWidget(QWidget):
         
         self.scroll_offset = max(0, min(1.0, new_start_ms / self.duration_ms))
         
+        self._pix_key = None
         self.update()
 
+    def resizeEvent(self, event):
+        self._pix_key = None
+        super().resizeEvent(event)
+
     def get_range(self):
         """Get the current start/end range in milliseconds"""
         return int(self.start_ms), int(self.end_ms)
@@ -274,7 +455,7 @@ class WaveformWidget(QWidget):
 class AudioEditorWindow(QDialog):
     """Window for precise audio slicing"""
     
-    def __init__(self, audio_groups, current_group, current_word_idx, processor, parent=None):
+    def __init__(self, audio_groups, current_group, current_word_idx, processor, parent=None, temp_pool=None):
         super().__init__(parent)
         self.setWindowTitle("Audio Slice Editor")
         self.resize(1000, 600)
@@ -283,8 +464,14 @@ class AudioEditorWindow(QDialog):
         self.current_group = current_group
         self.current_word_idx = current_word_idx
         self.processor = processor
+        self.temp_pool = temp_pool or TempPool()
         self.media_player = QMediaPlayer()
         
+        # What this session did to the group, so the caller can update its
+        # views in place: rows removed (in deletion order) and rows edited
+        # (final numbering)
+        self.result_diff = {'removed': [], 'changed': set()}
+        
         self.init_ui()
         # Load the current word AFTER UI is fully built
         self.load_current_word()
@@ -306,10 +493,8 @@ class AudioEditorWindow(QDialog):
         left_layout.addWidget(btn_delete)
         
         # Populate list (but don't connect signal yet)
-        group_data = self.audio_groups[self.current_group]
-        for i, seg in enumerate(group_data['segments']):
-            item = QListWidgetItem(f"Word {i+1}: {int(seg['start'])}ms - {int(seg['end'])}ms")
-            self.word_list.addItem(item)
+        self._build_segment_views()
+        self.word_list.addItems(self._labels)
         
         left_panel.setFixedWidth(250)
         layout.addWidget(left_panel)
@@ -355,15 +540,22 @@ class AudioEditorWindow(QDialog):
         # Set initial selection
         self.word_list.setCurrentRow(self.current_word_idx)
 
+    def _build_segment_views(self):
+        """Precompute per-word source paths and list labels for the group"""
+        group_data = self.audio_groups[self.current_group]
+        segments = group_data['segments']
+        self._files_view = [seg.get('file_path', group_data['file_path']) for seg in segments]
+        self._labels = [f"Word {i+1}: {int(seg['start'])}ms - {int(seg['end'])}ms"
+                        for i, seg in enumerate(segments)]
+
     def load_current_word(self):
         """Load waveform data for the current word"""
         idx = self.current_word_idx
         if idx < 0: 
             return
         
-        group_data = self.audio_groups[self.current_group]
-        segment = group_data['segments'][idx]
-        file_path = segment.get('file_path', group_data['file_path'])
+        segment = self.audio_groups[self.current_group]['segments'][idx]
+        file_path = self._files_view[idx]
         
         self.lbl_info.setText(f"Editing Word {idx+1}")
         
@@ -385,13 +577,17 @@ class AudioEditorWindow(QDialog):
         group_data = self.audio_groups[self.current_group]
         
         # Update data
-        group_data['segments'][idx]['start'] = start
-        group_data['segments'][idx]['end'] = end
-        group_data['segments'][idx]['duration'] = end - start
+        segment = group_data['segments'][idx]
+        segment['start'] = start
+        segment['end'] = end
+        segment['duration'] = end - start
         
         # Update list item text
-        item = self.word_list.item(idx)
-        item.setText(f"Word {idx+1}: {start}ms - {end}ms")
+        label = f"Word {idx+1}: {start}ms - {end}ms"
+        if label != self._labels[idx]:
+            self._labels[idx] = label
+            self.word_list.item(idx).setText(label)
+            self.result_diff['changed'].add(idx)
 
     def save_changes(self):
         """Explicitly save changes (with user confirmation)"""
@@ -420,14 +616,19 @@ class AudioEditorWindow(QDialog):
             if current_row < len(group_data.get('text_words', [])):
                 del group_data['text_words'][current_row]
             
+            self.result_diff['removed'].append(current_row)
+            self.result_diff['changed'] = {i if i < current_row else i - 1
+                                           for i in self.result_diff['changed'] if i != current_row}
+            
             # Temporarily disconnect signal to prevent change_word from being called
             self.word_list.currentRowChanged.disconnect(self.change_word)
             
-            # Refresh the list
+            # Refresh the list (labels after the deleted row are renumbered)
+            self._build_segment_views()
+            self.word_list.setUpdatesEnabled(False)
             self.word_list.clear()
-            for i, seg in enumerate(group_data['segments']):
-                item = QListWidgetItem(f"Word {i+1}: {int(seg['start'])}ms - {int(seg['end'])}ms")
-                self.word_list.addItem(item)
+            self.word_list.addItems(self._labels)
+            self.word_list.setUpdatesEnabled(True)
             
             # Select next word or previous if last was deleted
             new_row = min(current_row, self.word_list.count() - 1)
@@ -444,24 +645,16 @@ class AudioEditorWindow(QDialog):
     def play_slice(self):
         """Play the current audio slice"""
         start, end = self.waveform.get_range()
-        group_data = self.audio_groups[self.current_group]
-        segment = group_data['segments'][self.current_word_idx]
-        file_path = segment.get('file_path', group_data['file_path'])
+        file_path = self._files_view[self.current_word_idx]
         
         # Stop and clear previous media to release file lock
         self.media_player.stop()
         self.media_player.setMedia(QMediaContent())
         
-        # Clean up old temp file if it exists
-        old_temp = "temp_playback_editor.wav"
-        if os.path.exists(old_temp):
-            try:
-                os.remove(old_temp)
-            except:
-                pass
-        
-        # Get temp file (use 'editor' context to avoid conflicts)
-        temp_file = self.processor.get_temp_segment_file(file_path, start, end, context="editor")
+        # Get temp file (use 'editor' context to avoid conflicts); the
+        # previous one is replaced in place
+        temp_file = self.processor.get_temp_segment_file(file_path, start, end, context="editor",
+                                                         output_path=str(self.temp_pool.acquire("editor")))
         if temp_file:
             self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(os.path.abspath(temp_file))))
             self.media_player.play()
@@ -502,13 +695,9 @@ class AudioEditorWindow(QDialog):
             self.save_changes_internal(self.word_list.currentRow())
         
         # Cleanup temp files
-        temp_files = ["temp_playback_editor.wav", "temp_full_source_editor.wav"]
-        for temp_file in temp_files:
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
+        self.media_player.stop()
+        self.media_player.setMedia(QMediaContent())
+        self.temp_pool.release("editor")
         
         super().closeEvent(event)
 
@@ -516,6 +705,9 @@ class AudioEditorWindow(QDialog):
 class NewExperimentWizard(QWidget):
     """Wizard for creating a new experiment with audio groups and word lists"""
     
+    SEGMENT_CACHE_SIZE = 64  # Extracted playback files kept on disk
+    SOURCE_CACHE_SIZE = 2  # Decoded sources kept in memory to cut slices from
+    
     def __init__(self, parent):
         super().__init__()
         self.parent = parent
@@ -523,7 +715,30 @@ class NewExperimentWizard(QWidget):
         self.audio_groups = {}  # {group_name: {'file_path': str, 'segments': [], 'text_words': []}}
         self.current_group = None
         self.media_player = QMediaPlayer()
+        # One entry per slice of the current group: switching slices moves the
+        # playlist index instead of tearing down and re-setting the player media
+        self.playlist = QMediaPlaylist()
+        self.playlist.setPlaybackMode(QMediaPlaylist.CurrentItemOnce)
+        self.media_player.setPlaylist(self.playlist)
         self.loaded_properties = None  # Store loaded experiment properties
+        self._valid_count = 0  # Number of groups with data['valid'] set
+        self._segment_cache = OrderedDict()  # (file_path, start, end) -> extracted temp WAV, LRU order
+        self._prefetching = {}  # key -> queued or running _SegmentPrefetchJob
+        # Bumped by clear_segment_cache so jobs finishing afterwards are discarded
+        self._prefetch_generation = 0
+        # One worker: prefetch stays behind playback instead of competing with it
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(1)
+        # file_path -> (frames, frame_rate, sample_width), LRU order; shared with
+        # the prefetch worker, hence the lock
+        self._decoded_sources = OrderedDict()
+        self._source_lock = threading.Lock()
+        
+        # Coalesce validation while typing into one pass after a short pause
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(150)
+        self._validate_timer.timeout.connect(self.validate_current_group)
         
         self.init_ui()
         
@@ -579,6 +794,7 @@ class NewExperimentWizard(QWidget):
         preview_layout = QVBoxLayout()
         self.slice_list = QListWidget()
         self.slice_list.itemDoubleClicked.connect(self.play_slice)
+        self.slice_list.currentRowChanged.connect(self._prefetch_neighbors)
         
         # Enable drag and drop for reordering
         self.slice_list.setDragEnabled(True)
@@ -634,7 +850,7 @@ class NewExperimentWizard(QWidget):
         
         self.text_edit = QTextEdit()
         self.text_edit.setPlaceholderText("Enter words here (one per line)\nNumber of lines must match number of audio slices.")
-        self.text_edit.textChanged.connect(self.validate_current_group)
+        self.text_edit.textChanged.connect(self._validate_timer.start)
         text_layout.addWidget(self.text_edit)
         
         self.lbl_status = QLabel("Waiting for input...")
@@ -671,6 +887,7 @@ class NewExperimentWizard(QWidget):
             return
 
         # Process files
+        added_groups = []
         for file_path in files:
             path = Path(file_path)
             group_name = path.stem
@@ -697,7 +914,7 @@ class NewExperimentWizard(QWidget):
                     'valid': False
                 }
                 
-                self.group_list.addItem(group_name)
+                added_groups.append(group_name)
                 
                 # Check for matching text file
                 txt_path = path.with_suffix('.txt')
@@ -711,6 +928,11 @@ class NewExperimentWizard(QWidget):
                 QApplication.restoreOverrideCursor()
                 QMessageBox.critical(self, "Error", f"Failed to process {path.name}: {e}")
 
+        if added_groups:
+            self.group_list.setUpdatesEnabled(False)
+            self.group_list.addItems(added_groups)
+            self.group_list.setUpdatesEnabled(True)
+
         # Select last added
         if self.group_list.count() > 0:
             self.group_list.setCurrentRow(self.group_list.count() - 1)
@@ -760,6 +982,8 @@ class NewExperimentWizard(QWidget):
             
             # Clear existing data
             self.audio_groups.clear()
+            self.clear_segment_cache()
+            self._valid_count = 0
             self.loaded_properties = config.get('properties', {})
             
             # Load audio files and word associations
@@ -805,13 +1029,17 @@ class NewExperimentWizard(QWidget):
                         'temp_dir': temp_dir,  # Store for cleanup later
                         'audio_dir': str(audio_dir)  # Store audio directory
                     }
+            self._valid_count = sum(1 for g in self.audio_groups.values() if g['valid'])
             
             QApplication.restoreOverrideCursor()
             
-            # Update UI
+            # Update UI in one batch
+            self.group_list.setUpdatesEnabled(False)
+            self.group_list.blockSignals(True)
             self.group_list.clear()
-            for group_name in sorted(self.audio_groups.keys()):
-                self.group_list.addItem(group_name)
+            self.group_list.addItems(sorted(self.audio_groups.keys()))
+            self.group_list.blockSignals(False)
+            self.group_list.setUpdatesEnabled(True)
             
             # Select first group
             if self.group_list.count() > 0:
@@ -836,6 +1064,9 @@ class NewExperimentWizard(QWidget):
 
     def select_group(self, item):
         """Handle selection of an audio group"""
+        # Commit pending edits to the group being left
+        self.flush_pending_validation()
+        
         if not item:
             self.btn_edit_slices.setEnabled(False)
             self.btn_insert_word.setEnabled(False)
@@ -846,10 +1077,15 @@ class NewExperimentWizard(QWidget):
         self.current_group = group_name
         data = self.audio_groups[group_name]
         
-        # Populate slice list
+        # Populate slice list in one batch
+        labels = [f"Word {i+1} ({int(seg['duration'])}ms)" for i, seg in enumerate(data['segments'])]
+        self.slice_list.setUpdatesEnabled(False)
+        self.slice_list.blockSignals(True)
         self.slice_list.clear()
-        for i, seg in enumerate(data['segments']):
-            self.slice_list.addItem(f"Word {i+1} ({int(seg['duration'])}ms)")
+        self.slice_list.addItems(labels)
+        self.slice_list.blockSignals(False)
+        self.slice_list.setUpdatesEnabled(True)
+        self._load_group_playlist(data)
             
         self.btn_edit_slices.setEnabled(True)
         self.btn_insert_word.setEnabled(True)
@@ -857,10 +1093,10 @@ class NewExperimentWizard(QWidget):
             
         # Populate text
         if 'pending_text' in data:
-            self.text_edit.setPlainText(data['pending_text'])
+            self.set_word_text(data['pending_text'])
             del data['pending_text']
         else:
-            self.text_edit.setPlainText("\n".join(data['text_words']))
+            self.set_word_text("\n".join(data['text_words']))
             
         self.validate_current_group()
 
@@ -868,6 +1104,7 @@ class NewExperimentWizard(QWidget):
         """Open the audio slice editor dialog"""
         if not self.current_group: 
             return
+        self.flush_pending_validation()
         
         current_row = self.slice_list.currentRow()
         if current_row < 0: 
@@ -878,20 +1115,44 @@ class NewExperimentWizard(QWidget):
             self.current_group, 
             current_row, 
             self.processor, 
-            self
+            self,
+            temp_pool=self.parent.temp_pool
         )
         editor.exec_()
         
-        # Refresh list after edit
-        self.select_group(self.group_list.currentItem())
+        # Refresh list after edit; the editor only removes and edits rows of
+        # this group, which result_diff always describes
+        self._apply_editor_diff(editor.result_diff)
         # Restore selection
         if current_row < self.slice_list.count():
             self.slice_list.setCurrentRow(current_row)
 
+    def _apply_editor_diff(self, diff):
+        """Update the slice list in place from a slice editor result_diff"""
+        data = self.audio_groups[self.current_group]
+        segments = data['segments']
+        
+        self.slice_list.setUpdatesEnabled(False)
+        self.slice_list.blockSignals(True)
+        for row in diff['removed']:
+            self.slice_list.takeItem(row)
+        # Rows after the first removal are renumbered, edited rows relabelled
+        first_shifted = min(diff['removed'], default=len(segments))
+        for row in sorted(diff['changed'].union(range(first_shifted, len(segments)))):
+            self.slice_list.item(row).setText(f"Word {row+1} ({int(segments[row]['duration'])}ms)")
+        self.slice_list.blockSignals(False)
+        self.slice_list.setUpdatesEnabled(True)
+        
+        if diff['removed']:
+            # The editor dropped the matching text lines as well
+            self.set_word_text("\n".join(data['text_words']))
+        self.validate_current_group()
+
     def delete_word(self):
         """Delete the currently selected word"""
         if not self.current_group:
             return
+        self.flush_pending_validation()
             
         current_row = self.slice_list.currentRow()
         if current_row < 0:
@@ -925,6 +1186,7 @@ class NewExperimentWizard(QWidget):
         """Insert a new word with a zero-length slice at the beginning of the audio"""
         if not self.current_group:
             return
+        self.flush_pending_validation()
         
         group_data = self.audio_groups[self.current_group]
         
@@ -951,14 +1213,16 @@ class NewExperimentWizard(QWidget):
         # Update text edit to show the new empty line at the top
         current_text = self.text_edit.toPlainText()
         if current_text:
-            self.text_edit.setPlainText('\n' + current_text)
+            self.set_word_text('\n' + current_text)
         else:
-            self.text_edit.setPlainText('')
+            self.set_word_text('')
+        self.validate_current_group()
 
     def on_slices_reordered(self, parent, start, end, destination, row):
         """Handle reordering of slices via drag-and-drop"""
         if not self.current_group:
             return
+        self.flush_pending_validation()
         
         group_data = self.audio_groups[self.current_group]
         
@@ -983,7 +1247,7 @@ class NewExperimentWizard(QWidget):
                 group_data['text_words'].append(text_word)
         
         # Update the text editor to reflect new order
-        self.text_edit.setPlainText('\n'.join(group_data['text_words']))
+        self.set_word_text('\n'.join(group_data['text_words']))
         
         # Validate after reordering
         self.validate_current_group()
@@ -994,9 +1258,34 @@ class NewExperimentWizard(QWidget):
             return
             
         file_path, _ = QFileDialog.getOpenFileName(self, "Select Text File", "", "Text Files (*.txt)")
-        if file_path:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.text_edit.setPlainText(f.read())
+        if not file_path:
+            return
+        
+        # Read off the UI thread so large word lists don't freeze the window
+        group_name = self.current_group
+        self._text_reader = _TextFileReader()
+        self._text_reader.done.connect(self._on_text_file_loaded, Qt.QueuedConnection)
+        reader = self._text_reader
+        threading.Thread(
+            target=lambda: reader.done.emit(
+                group_name, Path(file_path).read_text(encoding='utf-8', errors='replace')),
+            daemon=True
+        ).start()
+
+    def _on_text_file_loaded(self, group_name, text):
+        """Apply a loaded word list to the group it was requested for"""
+        if group_name == self.current_group:
+            self.set_word_text(text)
+            self.validate_current_group()
+        elif group_name in self.audio_groups:
+            # User moved on to another group meanwhile; apply on next select
+            self.audio_groups[group_name]['pending_text'] = text
+
+    def set_word_text(self, text):
+        """Replace the word list text without queuing a validation; callers validate once"""
+        self.text_edit.blockSignals(True)
+        self.text_edit.setPlainText(text)
+        self.text_edit.blockSignals(False)
 
     def validate_current_group(self):
         """Validate that text words match audio slices"""
@@ -1012,25 +1301,32 @@ class NewExperimentWizard(QWidget):
         
         data['text_words'] = lines
         
-        if audio_count == text_count:
+        valid = audio_count == text_count
+        if valid:
             self.lbl_status.setText(f"✓ Match! {audio_count} words.")
             self.lbl_status.setStyleSheet("color: green; font-weight: bold;")
-            data['valid'] = True
         else:
             self.lbl_status.setText(f"⚠ Mismatch: {audio_count} audio slices vs {text_count} text lines.")
             self.lbl_status.setStyleSheet("color: red; font-weight: bold;")
-            data['valid'] = False
+        if data['valid'] != valid:
+            self._valid_count += 1 if valid else -1
+            data['valid'] = valid
             
         self.check_all_valid()
 
+    def flush_pending_validation(self):
+        """Run a debounced validation now if one is still waiting"""
+        if self._validate_timer.isActive():
+            self._validate_timer.stop()
+            self.validate_current_group()
+
     def check_all_valid(self):
         """Check if all groups are valid and enable/disable Next button"""
         if not self.audio_groups:
             self.btn_next.setEnabled(False)
             return
             
-        all_valid = all(g['valid'] for g in self.audio_groups.values())
-        self.btn_next.setEnabled(all_valid)
+        self.btn_next.setEnabled(self._valid_count == len(self.audio_groups))
 
     def play_slice(self, item):
         """Play the selected audio slice"""
@@ -1044,25 +1340,165 @@ class NewExperimentWizard(QWidget):
         segment = data['segments'][row]
         file_path = segment.get('file_path', data['file_path'])
         
-        # Stop and clear previous media to release file lock
         self.media_player.stop()
-        self.media_player.setMedia(QMediaContent())
-        
-        # Clean up old temp file if it exists
-        old_temp = "temp_playback_main.wav"
-        if os.path.exists(old_temp):
-            try:
-                os.remove(old_temp)
-            except:
-                pass
-        
-        # Get temp file for playback (use 'main' context to avoid conflicts)
-        temp_file = self.processor.get_temp_segment_file(file_path, segment['start'], segment['end'], context="main")
+        cached = self._segment_cache.get((file_path, segment['start'], segment['end']))
+        detached = not (cached and os.path.exists(cached))
+        if detached:
+            # Extraction replaces a pooled path the current playlist item may
+            # still hold open; detach the playlist to release the file lock
+            self.media_player.setMedia(QMediaContent())
+        temp_file = self.get_segment_file(file_path, segment['start'], segment['end'])
+        if detached:
+            self.media_player.setPlaylist(self.playlist)
         
         if temp_file and os.path.exists(temp_file):
-            self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(os.path.abspath(temp_file))))
+            self._sync_playlist_entry(data, row, temp_file)
+            self.playlist.setCurrentIndex(row)
             self.media_player.play()
 
+    def _load_group_playlist(self, data):
+        """Fill the playlist with the group's slices, at the paths they are extracted to"""
+        self.media_player.stop()
+        self.playlist.clear()
+        contents = []
+        for segment in data['segments']:
+            key = (segment.get('file_path', data['file_path']), segment['start'], segment['end'])
+            path = self._segment_cache.get(key) or self.parent.temp_pool.acquire(self._segment_context(key))
+            contents.append(QMediaContent(QUrl.fromLocalFile(os.path.abspath(path))))
+        self.playlist.addMedia(contents)
+
+    def _sync_playlist_entry(self, data, row, temp_file):
+        """Repair the playlist after slices were edited, reordered or extracted elsewhere"""
+        if self.playlist.mediaCount() != len(data['segments']):
+            self._load_group_playlist(data)
+        url = QUrl.fromLocalFile(os.path.abspath(temp_file))
+        if self.playlist.media(row).canonicalUrl() != url:
+            self.playlist.removeMedia(row)
+            self.playlist.insertMedia(row, QMediaContent(url))
+
+    def get_segment_file(self, file_path, start_ms, end_ms):
+        """Return a playback WAV for the slice, extracting it only on a cache miss"""
+        key = (file_path, start_ms, end_ms)
+        temp_file = self._segment_cache.get(key)
+        if temp_file and os.path.exists(temp_file):
+            self._segment_cache.move_to_end(key)
+            return temp_file
+        
+        context = self._segment_context(key)
+        if key in self._prefetching:
+            # A pool thread may be writing the prefetch file right now
+            context += "_play"
+        temp_file = self._extract_segment(key, str(self.parent.temp_pool.acquire(context)))
+        if temp_file:
+            self._store_segment(key, temp_file)
+        return temp_file
+
+    def _extract_segment(self, key, output_path):
+        """Write a slice's playback WAV, cut from its decoded source (also runs on the prefetch thread)"""
+        file_path, start_ms, end_ms = key
+        try:
+            samples, frame_rate, sample_width = self._source_frames(file_path)
+            # Same bounds and ms -> frame rounding as AudioProcessor.get_temp_segment_file
+            first = int(max(0, int(start_ms)) * frame_rate / 1000)
+            last = int(int(end_ms) * frame_rate / 1000)
+            # Write next to it and swap it in, so a reader never sees a half-written file
+            partial = output_path + ".part"
+            with open(partial, 'wb') as f:
+                _write_wav_frames(f, samples[first:last], frame_rate, sample_width)
+            os.replace(partial, output_path)
+            return output_path
+        except Exception as e:
+            self.processor.log(f"Error extracting segment: {e}")
+            return None
+
+    def _source_frames(self, file_path):
+        """Decoded frames of a slice source, decoded once and shared by all its slices"""
+        with self._source_lock:
+            cached = self._decoded_sources.get(file_path)
+            if cached is None:
+                cached = self._decoded_sources[file_path] = _decode_pcm_frames(file_path, self.processor)
+                while len(self._decoded_sources) > self.SOURCE_CACHE_SIZE:
+                    self._decoded_sources.popitem(last=False)
+            self._decoded_sources.move_to_end(file_path)
+            return cached
+
+    @staticmethod
+    def _segment_context(key):
+        """One processor context per slice so cached files never overwrite each other"""
+        return "main_" + hashlib.md5(repr(key).encode('utf-8')).hexdigest()[:12]
+
+    def _store_segment(self, key, temp_file):
+        self._segment_cache[key] = temp_file
+        self._segment_cache.move_to_end(key)
+        while len(self._segment_cache) > self.SEGMENT_CACHE_SIZE:
+            _, evicted = self._segment_cache.popitem(last=False)
+            self._remove_temp_file(evicted)
+
+    def _prefetch_neighbors(self, row):
+        """Extract the slices around the selected one in the background"""
+        if row < 0 or not self.processor or not self.current_group:
+            return
+        data = self.audio_groups[self.current_group]
+        segments = data['segments']
+        wanted = []
+        for neighbor in (row - 1, row + 1):
+            if 0 <= neighbor < len(segments):
+                segment = segments[neighbor]
+                wanted.append((segment.get('file_path', data['file_path']), segment['start'], segment['end']))
+        
+        # Drop queued jobs for rows the user has already moved past
+        self._drop_queued_prefetches(keep=wanted)
+        
+        for key in wanted:
+            if key in self._segment_cache or key in self._prefetching:
+                continue
+            context = self._segment_context(key)
+            job = _SegmentPrefetchJob(self._extract_segment, key, str(self.parent.temp_pool.acquire(context)),
+                                      self._prefetch_generation)
+            job.signals.done.connect(self._on_segment_prefetched)
+            self._prefetching[key] = job
+            self._prefetch_pool.start(job)
+
+    def _drop_queued_prefetches(self, keep=()):
+        """Take prefetch jobs that have not started yet back off the pool"""
+        for key, job in list(self._prefetching.items()):
+            if key not in keep and self._prefetch_pool.tryTake(job):
+                del self._prefetching[key]
+
+    def _on_segment_prefetched(self, key, temp_file, generation):
+        self._prefetching.pop(key, None)
+        if not temp_file:
+            return
+        if generation != self._prefetch_generation:
+            # Finished after the cache was cleared (group deleted, package reloaded)
+            self._remove_temp_file(temp_file)
+            return
+        if key in self._segment_cache:
+            # play_slice got there first with its own copy
+            if self._segment_cache[key] != temp_file:
+                self._remove_temp_file(temp_file)
+            return
+        self._store_segment(key, temp_file)
+
+    def clear_segment_cache(self):
+        """Delete all cached playback files and decoded sources"""
+        self._drop_queued_prefetches()
+        self._prefetch_generation += 1
+        self.media_player.stop()
+        self.playlist.clear()
+        self._segment_cache.clear()
+        with self._source_lock:
+            self._decoded_sources.clear()
+        self.parent.temp_pool.release_all()
+
+    @staticmethod
+    def _remove_temp_file(temp_file):
+        try:
+            os.remove(temp_file)
+        except OSError:
+            # Already gone, or still held open by the player
+            pass
+
     def play_current_slice(self):
         """Play the currently selected slice"""
         self.play_slice(None)
@@ -1076,27 +1512,32 @@ class NewExperimentWizard(QWidget):
 
     def go_next(self):
         """Proceed to the experiment properties page"""
+        self.flush_pending_validation()
+        if not self.btn_next.isEnabled():
+            return
+        
         # Cleanup temp files before moving to next page
-        temp_files = ["temp_playback_main.wav", "temp_full_source_main.wav"]
-        for temp_file in temp_files:
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
+        self.clear_segment_cache()
         self.parent.show_experiment_properties(self.audio_groups, self.loaded_properties)
 
     def delete_selected_words(self):
         """Delete selected words from the current group"""
-        selected_items = self.slice_list.selectedItems()
-        if not selected_items:
+        # Selected rows straight from the selection model, highest first so
+        # earlier deletions don't shift the rows still to be deleted
+        rows = sorted({index.row() for index in self.slice_list.selectionModel().selectedRows()},
+                      reverse=True)
+        if not rows:
             QMessageBox.warning(self, "Warning", "No words selected for deletion.")
             return
+        self.flush_pending_validation()
 
         group_data = self.audio_groups[self.current_group]
-        for item in selected_items:
-            row = self.slice_list.row(item)
+        text_words = group_data.get('text_words', [])
+        for row in rows:
             del group_data['segments'][row]
+            # Keep text_words in sync, as delete_word does
+            if row < len(text_words):
+                del text_words[row]
 
         self.select_group(self.group_list.currentItem())
 
@@ -1108,7 +1549,12 @@ class NewExperimentWizard(QWidget):
             return
 
         group_name = current_item.text()
+        if self.audio_groups[group_name]['valid']:
+            self._valid_count -= 1
         del self.audio_groups[group_name]
+        self.clear_segment_cache()
+        if self.current_group == group_name:
+            self.current_group = None
         self.group_list.takeItem(self.group_list.row(current_item))
         self.slice_list.clear()
         self.text_edit.clear()
@@ -1226,6 +1672,8 @@ class ExperimentPropertiesPage(QWidget):
         
         # Create spin boxes for each group (will be populated in set_data)
         self.repeat_widgets = {}
+        self._reps = {}  # group_name -> repetitions, mirrored from the spin boxes
+        self._sorted_groups = []  # Group names in form row order
         self.repeat_container = QWidget()
         self.repeat_form = QFormLayout(self.repeat_container)
         repeat_layout.addWidget(self.repeat_container)
@@ -1289,6 +1737,7 @@ class ExperimentPropertiesPage(QWidget):
 
     def set_data(self, audio_groups, loaded_properties=None):
         """Set the audio groups data and configure UI with optional loaded properties"""
+        properties_changed = loaded_properties is not self.loaded_properties
         self.audio_groups = audio_groups
         self.loaded_properties = loaded_properties
         
@@ -1345,27 +1794,34 @@ class ExperimentPropertiesPage(QWidget):
             self.spin_rows.setValue(side)
             self.spin_cols.setValue(side)
         
-        # Clear and populate repeat widgets
-        while self.repeat_form.count():
-            child = self.repeat_form.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        self.repeat_widgets.clear()
+        # Update repeat widgets: only groups that came or went touch the form
+        repetitions = loaded_properties.get('repetitions', {}) if loaded_properties else {}
+        new_keys = set(audio_groups)
+        old_keys = set(self.repeat_widgets)
+        
+        for group_name in old_keys - new_keys:
+            self.repeat_form.removeRow(self.repeat_widgets.pop(group_name))
+            self._reps.pop(group_name, None)
+            self._sorted_groups.remove(group_name)
         
-        for group_name in sorted(audio_groups.keys()):
+        if properties_changed:
+            # Kept spin boxes hold the user's values unless new properties were loaded
+            for group_name in old_keys & new_keys:
+                self.repeat_widgets[group_name].setValue(repetitions.get(group_name, 1))
+        
+        for group_name in sorted(new_keys - old_keys):
             spin = QSpinBox()
             spin.setRange(1, 100)
             
             # Apply loaded repetitions if available
-            default_value = 1
-            if loaded_properties:
-                repetitions = loaded_properties.get('repetitions', {})
-                default_value = repetitions.get(group_name, 1)
-            
-            spin.setValue(default_value)
+            spin.setValue(repetitions.get(group_name, 1))
             spin.setFixedWidth(80)
+            self._reps[group_name] = spin.value()
+            spin.valueChanged.connect(lambda value, g=group_name: self._reps.__setitem__(g, value))
             self.repeat_widgets[group_name] = spin
-            self.repeat_form.addRow(f"{group_name}:", spin)
+            row = bisect.bisect_left(self._sorted_groups, group_name)
+            self._sorted_groups.insert(row, group_name)
+            self.repeat_form.insertRow(row, f"{group_name}:", spin)
 
     def export_package(self):
         """Export the experiment as a ZIP package"""
@@ -1382,7 +1838,7 @@ class ExperimentPropertiesPage(QWidget):
                 "cols": self.spin_cols.value()
             },
             "order": "random" if self.radio_random.isChecked() else "ordinal",
-            "repetitions": {group: spin.value() for group, spin in self.repeat_widgets.items()},
+            "repetitions": dict(self._reps),
             "proceed_condition": {
                 "type": "key" if self.radio_key.isChecked() else "time",
                 "key": self.combo_key.currentText(),
@@ -1422,59 +1878,65 @@ class ExperimentPropertiesPage(QWidget):
             # Get processor for audio extraction
             processor = self.parent.new_experiment.processor
             
-            # Create temporary directory for audio files
-            temp_dir = tempfile.mkdtemp()
-            
-            # Extract audio segments to temp files
-            audio_files_map = {}  # Map segment to filename
-            for group_name, data in self.audio_groups.items():
-                for i, segment in enumerate(data['segments']):
-                    filename = f"{group_name}_word_{i+1:03d}.wav"
-                    temp_audio_path = os.path.join(temp_dir, filename)
-                    
-                    # Extract segment using pydub
-                    source_path = segment.get('file_path', data['file_path'])
-                    
-                    # Convert to wav if needed
-                    temp_wav = os.path.join(temp_dir, f"temp_source_{group_name}_{i+1:03d}.wav")
-                    processor.convert_to_wav(source_path, temp_wav)
-                    
-                    sound = AudioSegment.from_wav(temp_wav)
-                    audio_segment = sound[segment['start']:segment['end']]
-                    audio_segment.export(temp_audio_path, format="wav")
-                    
-                    audio_files_map[(group_name, i)] = filename
-            
-            # Update words_data with filenames
+            # Name each slice's file; the audio itself is written further down
             for group_name, words_list in words_data.items():
                 for i, word_item in enumerate(words_list):
-                    word_item['file'] = audio_files_map[(group_name, i)]
+                    word_item['file'] = f"{group_name}_word_{i+1:03d}.wav"
                     del word_item['segment']
                     del word_item['source_file']
             
-            # Create temporary JSON file
             json_data = {
                 "properties": properties,
                 "words": words_data
             }
             
-            json_filename = os.path.join(temp_dir, f"{exp_name}.json")
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
-                
-            # Create ZIP
-            with zipfile.ZipFile(save_path, 'w') as zipf:
-                # Add JSON
-                zipf.write(json_filename, arcname=f"{exp_name}.json")
+            # Slices still to be cut from each source, so a decoded source is
+            # dropped as soon as its last slice has been written
+            pending_slices = {}
+            for data in self.audio_groups.values():
+                for segment in data['segments']:
+                    source_path = segment.get('file_path', data['file_path'])
+                    pending_slices[source_path] = pending_slices.get(source_path, 0) + 1
+            wav_cache = {}  # (samples, frame_rate, sample_width) per source file, converted once
+            
+            # Create ZIP with each slice streamed straight into its entry, no
+            # staging directory and only one slice in flight. Packages with many
+            # long slices can pass 4 GB, so ZIP64 records are allowed; entries
+            # are written before their size is known, so each forces ZIP64.
+            with zipfile.ZipFile(save_path, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as zipf:
+                # Add JSON - the only entry worth compressing. The manifest is read
+                # by the experiment runner, not by people, so it is written
+                # compact; switch to indent=2 if a hand-readable manifest is needed.
+                manifest_bytes = _manifest_bytes(json_data)
+                json_info = zipfile.ZipInfo(f"{exp_name}.json", date_time=time.localtime()[:6])
+                zipf.writestr(json_info, manifest_bytes,
+                              compress_type=zipfile.ZIP_DEFLATED, compresslevel=6)
                 
                 # Add Audio Files
-                for (group_name, idx), filename in audio_files_map.items():
-                    src_path = os.path.join(temp_dir, filename)
-                    if os.path.exists(src_path):
-                        zipf.write(src_path, arcname=f"audio/{filename}")
-            
-            # Cleanup temp directory
-            shutil.rmtree(temp_dir, ignore_errors=True)
+                for group_name, data in self.audio_groups.items():
+                    for i, segment in enumerate(data['segments']):
+                        filename = f"{group_name}_word_{i+1:03d}.wav"
+                        
+                        source_path = segment.get('file_path', data['file_path'])
+                        
+                        cached = wav_cache.get(source_path)
+                        if cached is None:
+                            cached = wav_cache[source_path] = _decode_pcm_frames(source_path, processor)
+                        
+                        # Slice by frame index (same rounding as pydub's ms slicing)
+                        samples, frame_rate, sample_width = cached
+                        first = int(segment['start'] * frame_rate / 1000)
+                        last = int(segment['end'] * frame_rate / 1000)
+                        samples = samples[first:last]
+                        
+                        # PCM is high-entropy, so entries are stored, not deflated
+                        info = zipfile.ZipInfo(f"audio/{filename}", date_time=time.localtime()[:6])
+                        with zipf.open(info, 'w', force_zip64=True) as entry:
+                            _write_wav_frames(entry, samples, frame_rate, sample_width)
+                        
+                        pending_slices[source_path] -= 1
+                        if not pending_slices[source_path]:
+                            del wav_cache[source_path]
             
             QApplication.restoreOverrideCursor()
             QMessageBox.information(self, "Success", f"Experiment package saved to:\n{save_path}")
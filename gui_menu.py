@@ -1,22 +1,215 @@
 import sys
 import os
 import json
+import importlib
 import subprocess
 import zipfile
 import shutil
 import math
 import time
 import stat
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from app_paths import ensure_dir, user_data_dir, asset_path
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QLabel, QFileDialog, QMessageBox, QApplication)
-from PyQt5.QtCore import Qt
+                             QLabel, QFileDialog, QMessageBox, QApplication, QProgressDialog)
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QFont
 
-# Import analyzer and experiment runner for direct launching
-import analyzer_refactored
-import tablet_experiment
+# The analyzer and experiment runner are launched as their own processes and are
+# bundled through hiddenimports, so they are only imported here on first access
+_LAZY_MODULES = ('analyzer_refactored', 'tablet_experiment')
+
+
+def __getattr__(name):
+    """Import the launcher targets on first attribute access (PEP 562)"""
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(name)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Optional incremental JSON parser for experiment configs
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional C JSON decoder for whole-file reads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json_file(path):
+    """Parse a UTF-8 JSON file from its raw bytes, using orjson when it is installed"""
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def read_experiment_summary(config_file):
+    """Return (rows, cols, word_counts, repetitions, order) from an experiment config.
+    
+    Only the grid, the repetition settings and the number of words per group
+    are needed to size an experiment, so with ijson the word lists are counted
+    while streaming instead of being built as Python objects.
+    """
+    if ijson is None:
+        config = load_json_file(config_file)
+        props = config.get('properties', {})
+        grid = props.get('grid', {})
+        word_counts = {group: len(words) for group, words in config.get('words', {}).items()}
+        return (grid.get('rows', 5), grid.get('cols', 5), word_counts,
+                props.get('repetitions', {}), props.get('order', 'random'))
+    
+    rows, cols, order = 5, 5, 'random'
+    word_counts = {}
+    repetitions = {}
+    group_item = None  # 'words.<group>.item' prefix of the group being counted
+    with open(config_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == group_item:
+                if event in ('start_map', 'start_array', 'string', 'number', 'boolean', 'null'):
+                    word_counts[group] += 1
+            elif prefix == 'words' and event == 'map_key':
+                group = value
+                group_item = f"words.{group}.item"
+                word_counts[group] = 0
+            elif prefix == 'properties.grid.rows':
+                rows = int(value)
+            elif prefix == 'properties.grid.cols':
+                cols = int(value)
+            elif prefix == 'properties.order':
+                order = value
+            elif prefix.startswith('properties.repetitions.') and event == 'number':
+                repetitions[prefix[len('properties.repetitions.'):]] = int(value)
+    return rows, cols, word_counts, repetitions, order
+
+
+# Copy buffer for unpacking experiment files (shutil's default is 64 KiB)
+EXTRACT_BUFFER_SIZE = 4 * 1024 * 1024
+# Compressed bytes handed to one extraction worker; tiny entries are grouped
+EXTRACT_BATCH_BYTES = 4 * 1024 * 1024
+EXTRACT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+def _make_writable(root):
+    """Add the write bit to everything under root that lacks it, in one scandir walk"""
+    pending = [os.fspath(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                try:
+                    mode = entry.stat(follow_symlinks=False).st_mode
+                    if not mode & stat.S_IWRITE:
+                        os.chmod(entry.path, mode | stat.S_IWRITE)
+                except OSError:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+
+
+class _CleanupError(Exception):
+    """The previous experiment's working directory could not be removed"""
+
+
+class _ExtractSignals(QObject):
+    """Signals for ExtractJob (QRunnable itself cannot emit)"""
+    progress = pyqtSignal(int)  # percent of uncompressed bytes extracted
+    finished = pyqtSignal(object)  # work_dir Path
+    failed = pyqtSignal(object)  # exception raised by the job
+
+
+class ExtractJob(QRunnable):
+    """Clear the working directory and unpack an experiment ZIP on a pool thread"""
+    
+    def __init__(self, file_path, work_dir):
+        super().__init__()
+        self.file_path = file_path
+        self.work_dir = Path(work_dir)
+        self.signals = _ExtractSignals()
+    
+    def run(self):
+        try:
+            self._clean_work_dir()
+            self._extract()
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(self.work_dir)
+    
+    def _clean_work_dir(self):
+        work_dir = self.work_dir
+        
+        if work_dir.exists():
+            try:
+                # Clear read-only flags up front, then remove in one go
+                _make_writable(work_dir)
+                shutil.rmtree(work_dir)
+            except Exception as e:
+                # If that fails, try to rename it to move it out of the way
+                try:
+                    timestamp = int(time.time())
+                    trash_dir = Path(f"trash_{timestamp}")
+                    os.rename(work_dir, trash_dir)
+                    shutil.rmtree(trash_dir, ignore_errors=True)
+                except Exception:
+                    raise _CleanupError(e)
+        
+        # Re-create directory if it was removed
+        if not work_dir.exists():
+            work_dir.mkdir()
+    
+    def _extract(self):
+        root = self.work_dir.resolve()
+        with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
+            infos = zip_ref.infolist()
+        total = sum(info.file_size for info in infos) or 1
+        
+        batches, batch, batch_bytes = [], [], 0
+        for info in infos:
+            batch.append(info)
+            batch_bytes += info.compress_size
+            if batch_bytes >= EXTRACT_BATCH_BYTES:
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+        if batch:
+            batches.append(batch)
+        
+        # zlib releases the GIL while inflating, so batches decompress in parallel
+        done = 0
+        last_percent = -1
+        with ThreadPoolExecutor(max_workers=EXTRACT_MAX_WORKERS) as executor:
+            futures = [executor.submit(self._extract_batch, batch, root) for batch in batches]
+            for future in as_completed(futures):
+                done += future.result()
+                percent = done * 100 // total
+                if percent != last_percent:
+                    last_percent = percent
+                    self.signals.progress.emit(percent)
+    
+    def _extract_batch(self, batch, root):
+        """Extract a group of entries through a private ZipFile handle, returns bytes written"""
+        with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
+            for info in batch:
+                self._extract_entry(zip_ref, info, root)
+        return sum(info.file_size for info in batch)
+    
+    @staticmethod
+    def _extract_entry(zip_ref, info, root):
+        """Write one archive entry under root with a large copy buffer"""
+        target = (root / info.filename).resolve()
+        if target != root and root not in target.parents:
+            raise ValueError(f"Archive entry escapes the experiment folder: {info.filename}")
+        if info.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with zip_ref.open(info) as src, open(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, EXTRACT_BUFFER_SIZE)
 
 
 class MainMenu(QWidget):
@@ -25,6 +218,9 @@ class MainMenu(QWidget):
     def __init__(self, parent):
         super().__init__()
         self.parent = parent
+        self._extract_job = None  # Running ExtractJob, kept alive until it reports back
+        self._extract_progress = None
+        self._analyzer_windows = []  # In-process analyzer windows (script mode only)
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignCenter)
         layout.setSpacing(20)
@@ -72,39 +268,37 @@ class MainMenu(QWidget):
         # Define working directory
         work_dir = ensure_dir(user_data_dir() / "current_experiment")
         
-        # Robust cleanup function
-        def on_rm_error(func, path, exc_info):
-            # Attempt to make the file writable and try again
-            os.chmod(path, stat.S_IWRITE)
-            try:
-                func(path)
-            except Exception:
-                pass
-
-        if work_dir.exists():
-            try:
-                # Try standard removal
-                shutil.rmtree(work_dir, onerror=on_rm_error)
-            except Exception as e:
-                # If that fails, try to rename it to move it out of the way
-                try:
-                    timestamp = int(time.time())
-                    trash_dir = Path(f"trash_{timestamp}")
-                    os.rename(work_dir, trash_dir)
-                    shutil.rmtree(trash_dir, ignore_errors=True)
-                except Exception as e2:
-                    QMessageBox.warning(self, "Warning", f"Could not clean previous experiment files.\nPlease ensure no experiment is currently running.\n\nError: {e}")
-                    return
-        
-        # Re-create directory if it was removed
-        if not work_dir.exists():
-            work_dir.mkdir()
+        # Cleanup and extraction run on a pool thread; the dialog follows its progress
+        self.btn_load.setEnabled(False)
+        self._extract_progress = QProgressDialog("Extracting experiment files...", None, 0, 100, self)
+        self._extract_progress.setWindowTitle("Loading Experiment")
+        self._extract_progress.setMinimumDuration(0)
+        self._extract_progress.setValue(0)
         
+        job = ExtractJob(file_path, work_dir)
+        job.signals.progress.connect(self._extract_progress.setValue)
+        job.signals.finished.connect(self._on_extract_done)
+        job.signals.failed.connect(self._on_extract_failed)
+        self._extract_job = job
+        QThreadPool.globalInstance().start(job)
+
+    def _finish_extract(self):
+        self._extract_job = None
+        self._extract_progress.close()
+        self._extract_progress = None
+        self.btn_load.setEnabled(True)
+
+    def _on_extract_failed(self, error):
+        self._finish_extract()
+        if isinstance(error, _CleanupError):
+            QMessageBox.warning(self, "Warning", f"Could not clean previous experiment files.\nPlease ensure no experiment is currently running.\n\nError: {error}")
+        else:
+            QMessageBox.critical(self, "Error", f"Failed to load experiment: {error}")
+
+    def _on_extract_done(self, work_dir):
+        """Summarize the extracted experiment and launch the runner"""
+        self._finish_extract()
         try:
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                zip_ref.extractall(work_dir)
-                
             # Find JSON config
             json_files = list(work_dir.glob("*.json"))
             if not json_files:
@@ -114,43 +308,31 @@ class MainMenu(QWidget):
             
             # Calculate pages needed
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                
-                props = config.get('properties', {})
-                grid = props.get('grid', {})
-                rows = grid.get('rows', 5)
-                cols = grid.get('cols', 5)
+                rows, cols, word_counts, repetitions, order = read_experiment_summary(config_file)
                 grid_size = rows * cols
                 
-                words_data = config.get('words', {})
-                repetitions = props.get('repetitions', {})
-                order = props.get('order', 'random')
-                
                 # Calculate total words including repetitions
                 if order == 'random':
                     # Random: each word repeated X times based on group
                     total_words = 0
-                    for group_name, word_list in words_data.items():
+                    for group_name, word_count in word_counts.items():
                         repeat_count = repetitions.get(group_name, 1)
-                        total_words += len(word_list) * repeat_count
+                        total_words += word_count * repeat_count
                 else:
                     # Ordinal: all groups played, then repeat entire sequence
                     max_repeats = max(repetitions.values()) if repetitions else 1
                     total_words = 0
-                    unique_word_count = sum(len(word_list) for word_list in words_data.values())
+                    unique_word_count = sum(word_counts.values())
                     
                     for rep in range(max_repeats):
-                        for group_name, word_list in words_data.items():
+                        for group_name, word_count in word_counts.items():
                             group_repeats = repetitions.get(group_name, 1)
                             if rep < group_repeats:
-                                total_words += len(word_list)
+                                total_words += word_count
                 
                 pages = math.ceil(total_words / grid_size)
                 refreshes = max(0, pages - 1)
                 
-                QApplication.restoreOverrideCursor()
-                
                 msg = f"Experiment Loaded:\n\n" \
                       f"• Total Words: {total_words}\n" \
                       f"• Grid Size: {rows}x{cols} ({grid_size} cells)\n" \
@@ -162,7 +344,6 @@ class MainMenu(QWidget):
                 
             except Exception as e:
                 print(f"Error calculating pages: {e}")
-                QApplication.restoreOverrideCursor()
             
             # Launch experiment
             if getattr(sys, 'frozen', False):
@@ -179,7 +360,6 @@ class MainMenu(QWidget):
                 subprocess.Popen([sys.executable, "tablet_experiment.py", str(config_file)])
             
         except Exception as e:
-            QApplication.restoreOverrideCursor()
             QMessageBox.critical(self, "Error", f"Failed to load experiment: {e}")
 
     def launch_analyzer(self):
@@ -195,9 +375,21 @@ class MainMenu(QWidget):
                 else:
                     QMessageBox.critical(self, "Error", f"Analyzer.exe not found at {analyzer_exe}")
             else:
-                # Running as script - launch as subprocess
+                # Running as script - open the analyzer in this process, which already
+                # has Qt loaded, instead of starting a second interpreter
+                try:
+                    import analyzer_refactored
+                except ImportError:
+                    analyzer_refactored = None
+                
                 script_path = Path("analyzer_refactored.py")
-                if script_path.exists():
+                if analyzer_refactored is not None:
+                    # Closed windows are released here rather than on close
+                    self._analyzer_windows = [w for w in self._analyzer_windows if w.isVisible()]
+                    window = analyzer_refactored.PenDataPlayer()
+                    window.show()
+                    self._analyzer_windows.append(window)
+                elif script_path.exists():
                     subprocess.Popen([sys.executable, str(script_path)])
                 else:
                     QMessageBox.critical(self, "Error", "analyzer_refactored.py not found!")
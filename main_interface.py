@@ -7,6 +7,7 @@ from PyQt5.QtWidgets import QApplication, QMainWindow, QStackedWidget
 # Import the modularized components
 from gui_menu import MainMenu
 from exp_initializer import NewExperimentWizard, ExperimentPropertiesPage
+from app_paths import TempPool
 
 
 class MainInterface(QMainWindow):
@@ -20,6 +21,9 @@ class MainInterface(QMainWindow):
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
         
+        # Shared temp playback files for the wizard pages
+        self.temp_pool = TempPool()
+        
         self.main_menu = MainMenu(self)
         self.new_experiment = NewExperimentWizard(self)
         self.experiment_properties = ExperimentPropertiesPage(self)
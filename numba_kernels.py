@@ -0,0 +1,93 @@
+"""
+Numeric kernels for the analyzer's per-event arrays.
+
+Each kernel is compiled with numba when it is installed; otherwise a plain
+NumPy implementation with the same results is used.
+"""
+
+import numpy as np
+
+# Optional JIT; everything here works without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+def _stroke_indices_loop(types, press_code, release_code):
+    """Indices of press and release events, in one pass over the type codes"""
+    n = types.shape[0]
+    starts = np.empty(n, dtype=np.int64)
+    ends = np.empty(n, dtype=np.int64)
+    n_starts = 0
+    n_ends = 0
+    for i in range(n):
+        if types[i] == press_code:
+            starts[n_starts] = i
+            n_starts += 1
+        elif types[i] == release_code:
+            ends[n_ends] = i
+            n_ends += 1
+    return starts[:n_starts], ends[:n_ends]
+
+
+def _bounds_loop(xs, ys):
+    """(min_x, min_y, max_x, max_y) of non-empty coordinate columns, in one pass"""
+    min_x = max_x = xs[0]
+    min_y = max_y = ys[0]
+    for i in range(1, xs.shape[0]):
+        x = xs[i]
+        y = ys[i]
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+    return min_x, min_y, max_x, max_y
+
+
+def downsample_keep_mask(xs, ys, ts, is_edge, target_interval_ms, min_distance_sq):
+    """Array form of the analyzer's downsample loop, returns a keep mask.
+
+    Each decision depends on the last kept event, so this stays a sequential
+    loop; it only pays off when compiled with numba.
+    """
+    n = xs.shape[0]
+    keep = np.zeros(n, dtype=np.bool_)
+    last = -1
+    last_time = 0.0
+    for i in range(n):
+        if is_edge[i] or last < 0:
+            keep[i] = True
+            last = i
+            last_time = ts[i]
+            continue
+        time_delta_ms = (ts[i] - last_time) * 1000.0 if last_time != 0.0 else 0.0
+        dx = xs[i] - xs[last]
+        dy = ys[i] - ys[last]
+        if time_delta_ms >= target_interval_ms or dx * dx + dy * dy >= min_distance_sq:
+            keep[i] = True
+            last = i
+            last_time = ts[i]
+    return keep
+
+
+if HAVE_NUMBA:
+    stroke_indices = njit(cache=True)(_stroke_indices_loop)
+    bounds = njit(cache=True)(_bounds_loop)
+    downsample_keep_mask_jit = njit(cache=True)(downsample_keep_mask)
+else:
+    def stroke_indices(types, press_code, release_code):
+        """Indices of press and release events"""
+        return np.flatnonzero(types == press_code), np.flatnonzero(types == release_code)
+
+    def bounds(xs, ys):
+        """(min_x, min_y, max_x, max_y) of non-empty coordinate columns"""
+        return xs.min(), ys.min(), xs.max(), ys.max()
+
+    downsample_keep_mask_jit = None